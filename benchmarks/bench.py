@@ -0,0 +1,405 @@
+"""
+Performance suite for the hot paths of *Py5*, runs offline with the standard library only.
+
+Usage:\n
+``python benchmarks/bench.py run [--filter noise] [--save baseline.json]``\n
+``python benchmarks/bench.py compare baseline.json current.json [--threshold 0.10]``\n
+Every benchmark reports the best and the median time per call over several repeats. 'compare' prints the change of
+the best times and exits with status 1 if any benchmark got slower than the threshold.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime as dt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from Py5 import Py5, Py5Context, Py5FileReader, Py5FileType, Py5Vector  # noqa: E402
+
+# name -> setup function returning the zero-argument callable to time
+BENCHMARKS = {}
+
+SMALL_LINES = 100
+LARGE_LINES = 100_000
+BATCH = 10_000
+
+# removed together with its files when the interpreter exits
+TMP_DIR = tempfile.TemporaryDirectory(prefix="py5-bench-")
+
+
+def benchmark(name: str):
+    """ Registers a setup function under the given name. """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def __write_file__(directory: str, name: str, lines: int, row) -> str:
+    file = os.path.join(directory, name)
+    with open(file, "w") as f:
+        f.writelines(row(i) for i in range(lines))
+    return file
+
+
+# noise
+@benchmark("noise/scalar")
+def bench_noise_scalar():
+    Py5.noise(0.0)
+    return lambda: Py5.noise(12.34, 5.67, 0.89)
+
+
+@benchmark("noise/batch-10k")
+def bench_noise_batch():
+    points = [(i * 0.01, i * 0.007) for i in range(BATCH)]
+    noise = Py5.noise
+    return lambda: [noise(x, y) for x, y in points]
+
+
+# dist
+@benchmark("dist/2d-scalar")
+def bench_dist_2d():
+    return lambda: Py5.dist(1.0, 2.0, 4.0, 6.0)
+
+
+@benchmark("dist/3d-scalar")
+def bench_dist_3d():
+    return lambda: Py5.dist(1.0, 2.0, 3.0, 4.0, 6.0, 8.0)
+
+
+@benchmark("dist/2d-batch-10k")
+def bench_dist_batch():
+    points = [(i, i * 0.5, i * 2.0, i * 1.5) for i in range(BATCH)]
+    dist = Py5.dist
+    return lambda: [dist(*p) for p in points]
+
+
+# nf
+@benchmark("nf/scalar")
+def bench_nf_scalar():
+    return lambda: Py5.nf(-20.2, left=4, right=3)
+
+
+@benchmark("nf/batch-10k")
+def bench_nf_batch():
+    values = [i * 1.25 - 5000 for i in range(BATCH)]
+    nf = Py5.nf
+    return lambda: [nf(v, 5, 2) for v in values]
+
+
+# Py5Vector
+@benchmark("vector/add")
+def bench_vector_add():
+    a = Py5Vector(1.0, 2.0, 3.0, 4.0)
+    b = Py5Vector(5.0, 6.0, 7.0, 8.0)
+    return lambda: a.add(b)
+
+
+@benchmark("vector/chain")
+def bench_vector_chain():
+    a = Py5Vector(1.0, 2.0, 3.0, 4.0)
+    b = Py5Vector(5.0, 6.0, 7.0, 8.0)
+    return lambda: a.add(b).sub(a).mult(b).div(b).scale(0.5)
+
+
+@benchmark("vector/add-batch-10k")
+def bench_vector_batch():
+    vectors = [Py5Vector(i, i + 1.0, i + 2.0, i + 3.0) for i in range(BATCH)]
+    offset = Py5Vector(1.0, 1.0, 1.0, 1.0)
+    return lambda: [v.add(offset) for v in vectors]
+
+
+# sin/cos, math functions against the PRECISION.TABLE lookup table
+@benchmark("trig/math-sin-scalar")
+def bench_math_sin():
+    return lambda: math.sin(1.234)
+
+
+@benchmark("trig/table-sin-scalar")
+def bench_table_sin():
+    sin = Py5.trig_table().sin
+    return lambda: sin(1.234)
+
+
+@benchmark("trig/table-sin-nearest-scalar")
+def bench_table_sin_nearest():
+    sin = Py5.trig_table(interpolation=False).sin
+    return lambda: sin(1.234)
+
+
+@benchmark("trig/math-cos-steps-10k")
+def bench_math_cos_steps():
+    step = Py5.TWO_PI / 4096
+    return lambda: array("d", map(math.cos, map(step.__mul__, range(BATCH))))
+
+
+@benchmark("trig/table-cos-steps-10k")
+def bench_table_cos_steps():
+    table = Py5.trig_table()
+    return lambda: table.cos_steps(BATCH)
+
+
+# Py5.map -> Py5.constrain -> Py5.lerp -> Py5.sin, composed per element against the fused expression
+@benchmark("expression/composed-10k")
+def bench_expression_composed():
+    values = [i * 0.0001 for i in range(BATCH)]
+    return lambda: [Py5.sin(Py5.lerp(0, Py5.TWO_PI, Py5.constrain(Py5.map(v, 0, 1, 0, 1), 0.1, 0.9))) for v in values]
+
+
+@benchmark("expression/fused-10k")
+def bench_expression_fused():
+    values = array("d", (i * 0.0001 for i in range(BATCH)))
+    out = array("d", values)
+    expression = Py5.expression().map(0, 1, 0, 1).constrain(0.1, 0.9).lerp(0, Py5.TWO_PI).sin()
+    return lambda: expression.evaluate(values, out)
+
+
+# steering angles for particles, noise per particle against flow field lookups
+@benchmark("flowfield/noise-per-particle-10k")
+def bench_flowfield_noise():
+    xs = [i * 0.37 % 640 for i in range(BATCH)]
+    ys = [i * 0.53 % 480 for i in range(BATCH)]
+    noise = Py5.noise
+    return lambda: [Py5Vector(math.cos(a), math.sin(a)) for a in
+                    (noise(x * 0.01, y * 0.01) * Py5.TWO_PI for x, y in zip(xs, ys))]
+
+
+@benchmark("flowfield/sample-10k")
+def bench_flowfield_sample():
+    xs = array("d", (i * 0.37 % 640 for i in range(BATCH)))
+    ys = array("d", (i * 0.53 % 480 for i in range(BATCH)))
+    out_x = array("d", xs)
+    out_y = array("d", ys)
+    field = Py5.flow_field(65, 49, cell_size=10, noise_scale=0.1)
+    return lambda: field.sample(xs, ys, out_x, out_y)
+
+
+# noise values to pixels, a Py5.Color per pixel against the colormap table
+@benchmark("colormap/color-per-pixel-10k")
+def bench_colormap_color():
+    values = [i / BATCH for i in range(BATCH)]
+    return lambda: bytearray(b"".join(bytes(Py5.color(int(v * 255), 0, 255 - int(v * 255)).get_tuple())
+                                      for v in values))
+
+
+@benchmark("colormap/apply-10k")
+def bench_colormap_apply():
+    values = array("d", (i / BATCH for i in range(BATCH)))
+    out = bytearray(BATCH * 4)
+    colormap = Py5.colormap("#00f", "#f00", size=4096)
+    return lambda: colormap.apply(values, out=out)
+
+
+# Py5Context, every worker thread runs its own angle mode
+THREADS = 4
+
+
+@benchmark("context/sin-10k")
+def bench_context_sin():
+    values = [i * 0.01 for i in range(BATCH)]
+    sin = Py5.sin
+    return lambda: [sin(v) for v in values]
+
+
+@benchmark("context/explicit-sin-10k")
+def bench_context_explicit_sin():
+    values = [i * 0.01 for i in range(BATCH)]
+    sin = Py5Context(Py5.MODE.DEGREES).sin
+    return lambda: [sin(v) for v in values]
+
+
+@benchmark("context/threads-4x10k-mixed-modes")
+def bench_context_threads():
+    values = [i * 0.01 for i in range(BATCH)]
+    contexts = [Py5Context(Py5.MODE.DEGREES if i % 2 else Py5.MODE.RADIANS) for i in range(THREADS)]
+    pool = ThreadPoolExecutor(THREADS)
+
+    def work(context: Py5Context) -> list[float]:
+        with context:
+            sin = Py5.sin
+            return [sin(v) for v in values]
+
+    return lambda: list(pool.map(work, contexts))
+
+
+# Py5.sampler
+@benchmark("sampler/weighted-10k-of-10k")
+def bench_sampler_weighted():
+    sampler = Py5.sampler(range(BATCH), [(i % 97) ** 2 for i in range(BATCH)], seed=1)
+    return lambda: sampler.sample_many(BATCH)
+
+
+@benchmark("sampler/weighted-single")
+def bench_sampler_single():
+    sampler = Py5.sampler(range(BATCH), [(i % 97) ** 2 for i in range(BATCH)], seed=1)
+    return sampler.sample
+
+
+@benchmark("sampler/unique-100-of-10k")
+def bench_sampler_unique():
+    sampler = Py5.sampler(range(BATCH), [(i % 97) ** 2 for i in range(BATCH)], seed=1)
+    return lambda: sampler.sample_unique(100)
+
+
+# Py5FileReader.read
+def __bench_read__(lines: int, ext: Py5FileType, row):
+    file = __write_file__(TMP_DIR.name, f"data.{ext.value}", lines, row)
+    return lambda: Py5FileReader.read(file, ext=ext)
+
+
+@benchmark("read/txt-small")
+def bench_read_txt_small():
+    return __bench_read__(SMALL_LINES, Py5FileType.TEXT, lambda i: f"line number {i}\twith some text\n")
+
+
+@benchmark("read/txt-large")
+def bench_read_txt_large():
+    return __bench_read__(LARGE_LINES, Py5FileType.TEXT, lambda i: f"line number {i}\twith some text\n")
+
+
+@benchmark("read/csv-small")
+def bench_read_csv_small():
+    return __bench_read__(SMALL_LINES, Py5FileType.EXCEL_SPREADSHEET, lambda i: f"{i},{i * 0.5},name{i}\n")
+
+
+@benchmark("read/csv-large")
+def bench_read_csv_large():
+    return __bench_read__(LARGE_LINES, Py5FileType.EXCEL_SPREADSHEET, lambda i: f"{i},{i * 0.5},name{i}\n")
+
+
+def __bench_read_gz__(background: bool):
+    import gzip
+    file = __write_file__(TMP_DIR.name, "data.csv", LARGE_LINES, lambda i: f"{i},{i * 0.5},name{i}\n")
+    with open(file, "rb") as f, gzip.open(file + ".gz", "wb") as g:
+        g.write(f.read())
+    return lambda: Py5FileReader.read(file + ".gz", ext=Py5FileType.EXCEL_SPREADSHEET, background=background)
+
+
+@benchmark("read/csv-large-gz")
+def bench_read_csv_large_gz():
+    return __bench_read_gz__(False)
+
+
+@benchmark("read/csv-large-gz-background")
+def bench_read_csv_large_gz_background():
+    return __bench_read_gz__(True)
+
+
+@benchmark("aggregate/csv-large")
+def bench_aggregate_csv_large():
+    file = __write_file__(TMP_DIR.name, "aggregate.csv", LARGE_LINES, lambda i: f"{i},{i * 0.5},name{i}\n")
+    return lambda: Py5FileReader.aggregate(file, (0, 1))
+
+
+@benchmark("read/md-large")
+def bench_read_md_large():
+    return __bench_read__(LARGE_LINES, Py5FileType.MARKDOWN, lambda i: f"## Heading {i}\n" if i % 10 == 0
+                          else f"  Some *text* with `code` {i}\n")
+
+
+@benchmark("parse/md-large")
+def bench_parse_md_large():
+    from Py5Markdown import Py5Markdown
+    file = __write_file__(TMP_DIR.name, "parse.md", LARGE_LINES, lambda i: f"## Heading {i}\n" if i % 10 == 0
+                          else f"  Some *text* with `code` and **bold** {i}\n")
+
+    def parse():
+        Py5Markdown.clear_cache()
+        return Py5FileReader.parse(file, Py5FileType.MARKDOWN)
+    return parse
+
+
+@benchmark("parse/md-large-cached")
+def bench_parse_md_large_cached():
+    file = __write_file__(TMP_DIR.name, "cached.md", LARGE_LINES, lambda i: f"Some *text* {i}\n")
+    Py5FileReader.parse(file, Py5FileType.MARKDOWN)
+    return lambda: Py5FileReader.parse(file, Py5FileType.MARKDOWN)
+
+
+def run(names: list[str], repeat: int) -> dict[str, dict[str, float]]:
+    """ Runs the given benchmarks and returns the best and median seconds per call for each. """
+    results = {}
+    for name in names:
+        func = BENCHMARKS[name]()
+        timer = timeit.Timer(func)
+        loops, _ = timer.autorange()
+        times = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+        results[name] = {"best": min(times), "median": statistics.median(times), "loops": loops}
+        print(f"{name:<36} best {__fmt__(min(times)):>10}  median {__fmt__(statistics.median(times)):>10}")
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """ Prints the relative change per benchmark and returns the names of those slower than 'threshold'. """
+    regressions = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            print(f"{name:<36} {'new':>10}")
+            continue
+        before = baseline["results"][name]["best"]
+        change = result["best"] / before - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<36} {__fmt__(before):>10} -> {__fmt__(result['best']):>10}  {change:+7.1%}{flag}")
+    return regressions
+
+
+def __fmt__(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--save", default=None, help="write the results as JSON to this file")
+
+    compare_parser = commands.add_parser("compare", help="compare two saved results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="relative slowdown which counts as a regression, default 0.10")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        names = [name for name in BENCHMARKS if args.filter in name]
+        results = run(names, args.repeat)
+        if args.save is not None:
+            with open(args.save, "w") as f:
+                json.dump({"meta": {"python": platform.python_version(),
+                                    "platform": platform.platform(),
+                                    "date": dt.now().isoformat(timespec="seconds")},
+                           "results": results}, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
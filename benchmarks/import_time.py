@@ -0,0 +1,65 @@
+"""
+Measures the cold import time of *Py5* with ``python -X importtime``.
+
+Usage: ``python benchmarks/import_time.py [--module Py5] [--runs 10] [--max-ms 50]``\n
+Every run starts a fresh interpreter, the best and the median cumulative time of the module are reported together
+with the modules it pulled in. With '--max-ms' the script exits with status 1 if the median is above the limit.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Modules which must only be loaded on first use.
+LAZY = ["csv", "re", "datetime", "enum", "random", "typing",
+        "Py5Vector", "Py5FileReader", "Py5Color", "Py5Debug", "Py5Types"]
+
+
+def import_time(module: str) -> tuple[float, list[str]]:
+    """ Imports 'module' in a fresh interpreter and returns its cumulative import time in ms and the loaded modules. """
+    env = dict(os.environ, PYTHONPATH=SRC)
+    probe = f"import sys; import {module}; print(' '.join(sys.modules))"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", probe],
+                          env=env, capture_output=True, text=True, check=True)
+    cumulative = None
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, _, name = line.rpartition("|")
+        if name.strip() == module:
+            cumulative = int(line.split("|")[1]) / 1000
+    if cumulative is None:
+        raise RuntimeError(f"No import time reported for '{module}'")
+    return cumulative, proc.stdout.split()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="Py5")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    times = []
+    loaded = []
+    for _ in range(args.runs):
+        cumulative, loaded = import_time(args.module)
+        times.append(cumulative)
+
+    median = statistics.median(times)
+    eager = [name for name in LAZY if name in loaded and name != args.module]
+    print(f"{args.module}: best {min(times):.2f} ms, median {median:.2f} ms over {args.runs} runs")
+    print(f"eagerly loaded: {', '.join(eager) if eager else 'none'}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"median import time above {args.max_ms:.2f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,136 @@
+from __future__ import annotations
+
+import math
+from array import array
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Union
+
+
 class Arrays:
+    """
+    Typed bulk operations for lists, *array.array*, *memoryview* and NumPy buffers.\n
+    Every operation works through slice assignment or a C-level builtin, so no per-element Python loop is run.
+    """
+
     @staticmethod
-    def fill(arr: list[any], val: any) -> list[any]:
-        for i in range(len(arr)):
-            arr[i] = val
+    def __is_numpy__(arr: any) -> bool:
+        return hasattr(arr, "dtype") and hasattr(arr, "fill")
+
+    @staticmethod
+    def __typecode__(arr: any) -> Optional[str]:
+        if type(arr) is array:
+            return arr.typecode
+        if type(arr) is memoryview:
+            return arr.format
+        return None
+
+    @staticmethod
+    def __repeat__(arr: any, val: any, n: int) -> Union[list[any], array]:
+        typecode = Arrays.__typecode__(arr)
+        if typecode is None:
+            return [val] * n
+        return array(typecode, [val]) * n
+
+    @staticmethod
+    def __typed__(dst: any, src: any) -> any:
+        typecode = Arrays.__typecode__(dst)
+        if typecode is None or Arrays.__typecode__(src) == typecode:
+            return src
+        return array(typecode, src)
+
+    @staticmethod
+    def fill(arr: Union[list[any], array, memoryview], val: any) -> Union[list[any], array, memoryview]:
+        """ Fills the whole buffer with 'val' in place and returns it. """
+        if Arrays.__is_numpy__(arr):
+            arr.fill(val)
+        else:
+            arr[:] = Arrays.__repeat__(arr, val, len(arr))
+        return arr
+
+    @staticmethod
+    def arange(start: Union[int, float], stop: Union[int, float] = None, step: Union[int, float] = 1,
+               typecode: str = "d") -> array:
+        """
+        Creates a typed array from 'start' (inclusive) to 'stop' (exclusive) with the given step.
+        :param start: The first value, or the stop value if 'stop' is not given.
+        :param stop: The end of the range, not included.
+        :param step: The increment between two values, must not be zero.
+        :param typecode: The *array.array* typecode of the result, default is *'d'*.
+        :return: The typed array.
+        """
+        if stop is None:
+            start, stop = 0, start
+        if step == 0:
+            raise ValueError("Argument 'step' must not be zero")
+        if type(start) is int and type(stop) is int and type(step) is int:
+            return array(typecode, range(start, stop, step))
+        start, step = float(start), float(step)
+        n = max(0, math.ceil((stop - start) / step))
+        return array(typecode, map(start.__add__, map(step.__mul__, range(n))))
+
+    @staticmethod
+    def copy(src: Union[list[any], array, memoryview], dst: Union[list[any], array, memoryview] = None) \
+            -> Union[list[any], array, memoryview]:
+        """
+        Copies 'src' into 'dst' in place, or returns a new buffer of the same type if 'dst' is not given.
+        :raises ValueError If 'dst' is given and has a different length than 'src'.
+        """
+        if dst is None:
+            if Arrays.__is_numpy__(src):
+                return src.copy()
+            if type(src) is memoryview:
+                return array(src.format, src)
+            return src[:]
+        if len(dst) != len(src):
+            raise ValueError(f"Expected a destination of length {len(src)}, got {len(dst)} instead")
+        dst[:] = Arrays.__typed__(dst, src)
+        return dst
+
+    @staticmethod
+    def assign(dst: Union[list[any], array, memoryview], src: Union[list[any], array, memoryview],
+               start: int = 0) -> Union[list[any], array, memoryview]:
+        """
+        Overwrites 'dst' with the values of 'src', beginning at index 'start', without changing its length.
+        :raises ValueError If 'src' does not fit into 'dst' at the given index.
+        """
+        stop = start + len(src)
+        if start < 0 or stop > len(dst):
+            raise ValueError(f"Cannot assign {len(src)} values at index {start} into a buffer of length {len(dst)}")
+        dst[start:stop] = Arrays.__typed__(dst, src)
+        return dst
+
+    @staticmethod
+    def sum(arr: Union[list[any], array, memoryview]) -> Union[int, float]:
+        """ Returns the sum of all values. """
+        if Arrays.__is_numpy__(arr):
+            return arr.sum()
+        return sum(arr)
+
+    @staticmethod
+    def min(arr: Union[list[any], array, memoryview]) -> any:
+        """ Returns the first smallest value. """
+        if Arrays.__is_numpy__(arr):
+            return arr.min()
+        return min(arr)
+
+    @staticmethod
+    def max(arr: Union[list[any], array, memoryview]) -> any:
+        """ Returns the first largest value. """
+        if Arrays.__is_numpy__(arr):
+            return arr.max()
+        return max(arr)
+
+    @staticmethod
+    def sort(arr: Union[list[any], array, memoryview], reverse: bool = False) -> Union[list[any], array, memoryview]:
+        """ Sorts the buffer in place and returns it. """
+        if type(arr) is list:
+            arr.sort(reverse=reverse)
+        elif Arrays.__is_numpy__(arr):
+            arr.sort()
+            if reverse:
+                arr[:] = arr[::-1].copy()
+        else:
+            arr[:] = array(Arrays.__typecode__(arr), sorted(arr, reverse=reverse))
         return arr
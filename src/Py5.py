@@ -1,34 +1,97 @@
-import csv as xls
+from __future__ import annotations
+
 import math
-import random
-import re
-from datetime import datetime as dt
-from enum import Enum
-from os import path
-from typing import TypeVar, Union, Optional
+from importlib import import_module
 
 from Arrays import Arrays
-from Py5Vector import Py5Vector
-
-
-class Py5:
+from Py5Context import Py5Context, CURRENT_CONTEXT
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Sequence, Union
+
+    from Py5Color import Color
+    from Py5Colormap import Py5Colormap
+    from Py5Expression import Py5Expression
+    from Py5FlowField import Py5FlowField
+    from Py5Sampler import Py5Sampler
+    from Py5Trig import Py5TrigTable
+    from Py5Types import MODE, COMPLEX, PRECISION, T
+    from Py5Vector import Py5Vector
+
+# Subsystems which are only imported on first attribute access, keeps ``import Py5`` cheap.
+# name -> (module, attribute)
+__lazy_modules__ = {
+    "Py5FileReader": ("Py5FileReader", "Py5FileReader"),
+    "Py5FileType": ("Py5FileReader", "Py5FileType"),
+    "Py5FileFollower": ("Py5FileReader", "Py5FileFollower"),
+    "Py5Vector": ("Py5Vector", "Py5Vector"),
+}
+
+
+def __getattr__(name: str) -> any:
+    if name not in __lazy_modules__:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module, attr = __lazy_modules__[name]
+    value = getattr(import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+class Py5Meta(type):
+    """ Loads the nested subsystems of *Py5* on first attribute access. """
+
+    # name -> (module, attribute)
+    __lazy_attributes__ = {
+        "T": ("Py5Types", "T"),
+        "MODE": ("Py5Types", "MODE"),
+        "COMPLEX": ("Py5Types", "COMPLEX"),
+        "PRECISION": ("Py5Types", "PRECISION"),
+        "precision": ("Py5Types", "DEFAULT_PRECISION"),
+        "Color": ("Py5Color", "Color"),
+        "Debug": ("Py5Debug", "Debug"),
+    }
+
+    def __getattr__(cls, name: str) -> any:
+        if name not in Py5Meta.__lazy_attributes__:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        module, attr = Py5Meta.__lazy_attributes__[name]
+        value = getattr(import_module(module), attr)
+        setattr(cls, name, value)
+        return value
+
+    @property
+    def mode(cls) -> MODE:
+        """ The angle mode of the current *Py5Context*. """
+        return CURRENT_CONTEXT.get().mode
+
+    @mode.setter
+    def mode(cls, mode: MODE) -> None:
+        CURRENT_CONTEXT.set(CURRENT_CONTEXT.get().replace(mode=mode))
+
+    @property
+    def cx(cls) -> COMPLEX:
+        """ The complex mode of the current *Py5Context*. """
+        return CURRENT_CONTEXT.get().cx
+
+    @cx.setter
+    def cx(cls, cx: COMPLEX) -> None:
+        CURRENT_CONTEXT.set(CURRENT_CONTEXT.get().replace(cx=cx))
+
+
+class Py5(metaclass=Py5Meta):
     """ An all-in-one tool to do multiple tasks easier. Current version: *0.2.6-c*"""
 
     __author__ = "Shiromi"
     __version__ = "0.2.6-c"
     __copyright__ = "Copyright (c) 2020-2021 Shiromi"
 
-    T = TypeVar('T', object, int, float, str)
-
     __PERLIN_Y_WRAP_B__ = 4
     __PERLIN_Y_WRAP__ = 1 << __PERLIN_Y_WRAP_B__
     __PERLIN_Z_WRAP_B__ = 8
     __PERLIN_Z_WRAP__ = 1 << __PERLIN_Z_WRAP_B__
     __PERLIN_SIZE__ = 4096
 
-    __perlin_octaves__ = 4
-    __perlin_amp_falloff__ = 0.5
-
     __perlin__ = None
 
     # static variables
@@ -46,18 +109,11 @@ class Py5:
     def double(x: float) -> float:
         return 2 * x
 
-    # used for changing modes
-    class MODE(Enum):
-        DEGREES = True
-        RADIANS = False
+    # MODE, COMPLEX, PRECISION and the default 'precision' are loaded lazily from Py5Types,
+    # 'mode' and 'cx' are read from the current Py5Context
 
-    class COMPLEX(Enum):
-        COMPLEX = True
-        SIMPLE = False
-
-    # default vars
-    mode = MODE.RADIANS
-    cx = COMPLEX.SIMPLE
+    # shared lookup table of PRECISION.TABLE mode
+    __trig_table__ = None
 
     # Error classes
     class Py5InternalError(Exception):
@@ -98,84 +154,147 @@ class Py5:
         """ Converts *degrees* to *radians*. """
         return deg * Py5.PI / 180
 
+    @staticmethod
+    def context() -> Py5Context:
+        """
+        Returns the math settings of the running thread or task.
+
+        New threads start with the default settings, use ``with Py5Context(...):`` to run a block with others.
+        """
+        return CURRENT_CONTEXT.get()
+
     @staticmethod
     def angle_mode(mode: MODE) -> None:
-        """ Set mode to radians or degrees. Default is MODE.RADIANS"""
+        """ Set mode to radians or degrees for the current context. Default is MODE.RADIANS"""
         if mode == Py5.mode:
             raise Py5.Py5ModeError(f"Mode already set to {mode}")
         Py5.mode = mode
 
     @staticmethod
     def complex_mode(cx: COMPLEX) -> None:
-        """ Changes between complex and simple mode, default is *COMPLEX.DISABLED (Simple)*"""
+        """ Changes between complex and simple mode for the current context, default is *COMPLEX.DISABLED (Simple)*"""
         if cx == Py5.cx:
             raise Py5.Py5ModeError(f"Mode already set to {cx}")
         Py5.cx = cx
 
+    @staticmethod
+    def noise_detail(octaves: int, falloff: float = 0.5) -> None:
+        """
+        Sets the amount of octaves and their falloff used by *noise* in the current context. Default is 4 and 0.5
+        """
+        CURRENT_CONTEXT.set(CURRENT_CONTEXT.get().replace(noise_octaves=octaves, noise_falloff=falloff))
+
+    @staticmethod
+    def precision_mode(precision: PRECISION, resolution: int = 4096, interpolation: bool = True) -> None:
+        """
+        Switches *sin* and *cos* between the exact math functions and a shared lookup table.
+        Default is PRECISION.EXACT\n
+        In CPython a scalar table lookup is slower than *math.sin*, the table only pays off for the batch functions
+        *sin_steps* and *cos_steps* of *trig_table*. The angle mode is still read from the current *Py5Context* on
+        every call.
+        :raises Py5ModeError If the mode is already set with the same table settings.
+        :param precision: PRECISION.TABLE or PRECISION.EXACT.
+        :param resolution: The amount of table samples per turn, has to be a power of two.
+        :param interpolation: Interpolates linearly between two samples if true, else uses the nearest sample.
+        """
+        table = Py5.trig_table(resolution, interpolation) if precision.value else None
+        if precision == Py5.precision and table is Py5.__trig_table__:
+            raise Py5.Py5ModeError(f"Mode already set to {precision}")
+        Py5.precision = precision
+        Py5.__trig_table__ = table
+        if table is None:
+            Py5.cos = staticmethod(Py5.__exact_cos__)
+            Py5.sin = staticmethod(Py5.__exact_sin__)
+        else:
+            Py5.cos = staticmethod(Py5.__table_cos__)
+            Py5.sin = staticmethod(Py5.__table_sin__)
+
+    @staticmethod
+    def trig_table(resolution: int = 4096, interpolation: bool = True) -> Py5TrigTable:
+        """
+        Returns the shared sine/cosine lookup table, for batch lookups of fixed angle steps with *sin_steps* or
+        *cos_steps*.
+
+        The maximum error is documented in *Py5TrigTable*.
+        """
+        from Py5Trig import Py5TrigTable
+        return Py5TrigTable.get(resolution, interpolation)
+
     @staticmethod
     def cos(n: float) -> float:
         """ Returns the cosine of the given value 'n' """
-        return math.cos(n) if not Py5.mode else math.cos(Py5.rad(n))
+        return CURRENT_CONTEXT.get().cos(n)
 
     @staticmethod
     def sin(n: float) -> float:
         """ Returns the sine of the given value 'n'. """
-        return math.sin(n) if not Py5.mode else math.sin(Py5.rad(n))
+        return CURRENT_CONTEXT.get().sin(n)
+
+    __exact_cos__ = cos
+    __exact_sin__ = sin
+
+    @staticmethod
+    def __table_cos__(n: float) -> float:
+        return Py5.__trig_table__.cos(n * Py5.PI / 180 if CURRENT_CONTEXT.get().degrees else n)
+
+    @staticmethod
+    def __table_sin__(n: float) -> float:
+        return Py5.__trig_table__.sin(n * Py5.PI / 180 if CURRENT_CONTEXT.get().degrees else n)
 
     @staticmethod
     def tan(n: float) -> float:
         """ Returns the tangent of the given value 'n'. """
-        return math.tan(n) if not Py5.mode else math.tan(Py5.rad(n))
+        return CURRENT_CONTEXT.get().tan(n)
 
     @staticmethod
     def asin(n: float) -> float:
         """ Returns the arc sine of 'n'. """
-        return math.asin(n) if not Py5.mode else math.asin(Py5.rad(n))
+        return CURRENT_CONTEXT.get().asin(n)
 
     @staticmethod
     def acos(n: float) -> float:
         """ Returns the arc cosine of 'n'. """
-        return math.acos(n) if not Py5.mode else math.acos(Py5.rad(n))
+        return CURRENT_CONTEXT.get().acos(n)
 
     @staticmethod
     def atan(n: float) -> float:
         """ Returns the arc tangent of 'n'. """
-        return math.atan(n) if not Py5.mode else math.atan(Py5.rad(n))
+        return CURRENT_CONTEXT.get().atan(n)
 
     @staticmethod
     def sinh(n: float) -> float:
         """ Returns the hyperbolic sine of 'n'. """
-        return math.sinh(n) if not Py5.mode else math.sinh(Py5.rad(n))
+        return CURRENT_CONTEXT.get().sinh(n)
 
     @staticmethod
     def cosh(n: float) -> float:
         """ Returns the hyperbolic cosine of 'n'. """
-        return math.cosh(n) if not Py5.mode else math.cosh(Py5.rad(n))
+        return CURRENT_CONTEXT.get().cosh(n)
 
     @staticmethod
     def tanh(n: float) -> float:
         """ Returns the hyperbolic tangent of 'n'. """
-        return math.tanh(n) if not Py5.mode else math.tanh(Py5.rad(n))
+        return CURRENT_CONTEXT.get().tanh(n)
 
     @staticmethod
     def asinh(n: float) -> float:
         """ Returns the inverse hyperbolic sine of 'n'. """
-        return math.asinh(n) if not Py5.mode else math.asinh(Py5.rad(n))
+        return CURRENT_CONTEXT.get().asinh(n)
 
     @staticmethod
     def acosh(n: float) -> float:
         """ Returns the inverse hyperbolic cosine of 'n'. """
-        return math.acosh(n) if not Py5.mode else math.acosh(Py5.rad(n))
+        return CURRENT_CONTEXT.get().acosh(n)
 
     @staticmethod
     def atanh(n: float) -> float:
         """ Returns the inverse hyperbolic tangent of 'n'. """
-        return math.atanh(n) if not Py5.mode else math.atanh(Py5.rad(n))
+        return CURRENT_CONTEXT.get().atanh(n)
 
     @staticmethod
     def atan2(x: float, y: float) -> float:
         """ Returns the arc tangent of x/y, """
-        return math.atan2(x, y) if not Py5.mode else math.atan2(Py5.rad(x), Py5.rad(y))
+        return CURRENT_CONTEXT.get().atan2(x, y)
 
     @staticmethod
     def pow(x: Union[float, int], n: Union[float, int]) -> float:
@@ -188,15 +307,7 @@ class Py5:
     @staticmethod
     def sqrt(x: Union[float, int]) -> Union[float, str]:
         """ Returns the square root of x. """
-        if type(x) is int:
-            x = float(x)
-        if not Py5.cx:
-            return math.sqrt(x)
-        else:
-            res = float(math.sqrt(abs(x)))
-            if x < 0:
-                res = str(res) + ' * i'
-            return res
+        return CURRENT_CONTEXT.get().sqrt(x)
 
     @staticmethod
     def root(x: Union[float, int], n: int) -> Union[float, str]:
@@ -205,14 +316,7 @@ class Py5:
         :param x Base
         :param n Denominator, exponent
         """
-        if n == 2:
-            return Py5.sqrt(x)
-        else:
-            res = Py5.pow(x, n)
-            if not Py5.cx:
-                return res
-            else:
-                return str(float(Py5.pow(abs(x), float(1/n)))) + " * i"
+        return CURRENT_CONTEXT.get().root(x, n)
 
     @staticmethod
     def __scaled_cos__(n: float) -> float:
@@ -297,25 +401,24 @@ class Py5:
         else:
             return Py5.constrain(new_val, stop2, start2)
 
+    @staticmethod
+    def expression() -> Py5Expression:
+        """
+        Returns an empty lazy expression, chain math functions on it and evaluate them over whole arrays at once.
+        ``Py5.expression().map(0, 255, 0, 1).lerp(0, Py5.PI).sin().evaluate(values)``
+        """
+        from Py5Expression import Py5Expression
+        return Py5Expression()
+
     @staticmethod
     def max(*args: float) -> float:
         """ Returns the maximum value from the given list. """
-        record_index = 0
-        for i in range(len(args)):
-            if args[i] > args[record_index]:
-                record_index = i
-
-        return args[record_index]
+        return Arrays.max(args)
 
     @staticmethod
     def min(*args: float) -> float:
         """ Returns the minimum value from the given list. """
-        record_index = 0
-        for i in range(len(args)):
-            if args[i] < args[record_index]:
-                record_index = i
-
-        return args[record_index]
+        return Arrays.min(args)
 
     @staticmethod
     def nf(n: float, left=0, right=0) -> str:
@@ -367,6 +470,7 @@ class Py5:
         dec_part = _n[decimal_index + 1:] if decimal_index != -1 else ''
         string = '-' if neg else ''
 
+        import re
         tmp = re.split(r"(?=(?:\d{3})*$)", int_part)
 
         tmp_string = ",".join(tmp)
@@ -381,22 +485,27 @@ class Py5:
 
     @staticmethod
     def choice(*arr: T) -> T:
-        """ Returns a random element from an array, same as *random.choice()* """
-        i = random.randint(0, len(arr) - 1)
-        return arr[i]
+        """
+        Returns a random element from an array, same as *random.choice()*.
+        For many draws, weights or a whole sequence use *Py5.sampler* instead.
+        """
+        import random
+        return random.choice(arr)
+
+    @staticmethod
+    def sampler(population: Sequence[T], weights: Optional[Sequence[float]] = None,
+                seed: Optional[Union[int, float, str, bytes]] = None) -> Py5Sampler:
+        """ Creates a seedable sampler which draws weighted elements in constant time, see *Py5Sampler*. """
+        from Py5Sampler import Py5Sampler
+        return Py5Sampler(population, weights, seed)
 
     @staticmethod
     def random(a: Union[int, float] = 0, b: Union[int, float] = 1) -> Union[int, float]:
-        if a is int and b is int:
-            if a == 0 and b == 1:
-                return random.randint(0, 1)
-            else:
-                return random.randint(a, b)
-        if a is float and b is float:
-            if a == 0 and b == 1:
-                return random.random()
-            else:
-                return random.random() * b + a
+        """ Returns a random integer between 'a' and 'b' if both are integers, otherwise a random float. """
+        import random
+        if type(a) is int and type(b) is int:
+            return random.randint(a, b)
+        return random.random() * (b - a) + a
 
     @staticmethod
     def noise(x: float, y=0, z=0) -> float:
@@ -421,8 +530,9 @@ class Py5:
 
         r = 0
         ampl = 0.5
+        context = CURRENT_CONTEXT.get()
 
-        for _ in range(Py5.__perlin_octaves__):
+        for _ in range(context.noise_octaves):
             of = xi + (yi << Py5.__PERLIN_Y_WRAP_B__) + (zi << Py5.__PERLIN_Z_WRAP_B__)
 
             rxf = Py5.__scaled_cos__(xf)
@@ -444,7 +554,7 @@ class Py5:
             n1 += Py5.__scaled_cos__(zf) * (n2 - n1)
 
             r += n1 * ampl
-            ampl *= Py5.__perlin_amp_falloff__
+            ampl *= context.noise_falloff
             xi <<= 1
             xf *= 2
             yi <<= 1
@@ -469,8 +579,16 @@ class Py5:
     @staticmethod
     def create_vector(x: float, y: float, z=0, w=0) -> Py5Vector:
         """ Creates a Vector with the given values. """
+        from Py5Vector import Py5Vector
         return Py5Vector(x, y, z, w)
 
+    @staticmethod
+    def flow_field(cols: int, rows: int, cell_size: float = 1.0, noise_scale: float = 0.1,
+                   angle_scale: float = TWO_PI, z: float = 0.0, z_step: float = 0.0) -> Py5FlowField:
+        """ Creates a flow field of precomputed noise directions, see *Py5FlowField*. """
+        from Py5FlowField import Py5FlowField
+        return Py5FlowField(cols, rows, cell_size, noise_scale, angle_scale, z, z_step)
+
     @staticmethod
     def promise(func, on_success=None, on_error=None, exception: Exception = BaseException) -> any:
         def default_success() -> None:
@@ -492,80 +610,12 @@ class Py5:
             else:
                 default_error()
 
-    class Debug(object):
-        def __init__(self, func):
-            self.func = func
-
-        def __log_call__(self, *args, **kwargs) -> any:
-            _now = dt.now()
-            _hour: str = _now.hour if _now.hour > 10 else f"0{_now.hour}"
-            _minute: str = _now.minute if _now.minute > 10 else f"0{_now.minute}"
-            _second: str = _now.second if _now.second > 10 else f"0{_now.second}"
-
-            print(f"{_hour}:{_minute}:{_second}: Executed: {self.func.__name__}"
-                  f"\n\tArguments: {args}"
-                  f"\n\tNamed Arguments: {kwargs}")
-
-            return self.func(*args, **kwargs)
-
     @staticmethod
     def debug(func) -> any:
         """ Usage as a decorator to get the function name and parameters as debug info\n
         ``@Py5.debug def method_name(*args): pass`` """
         return Py5.Debug(func).__log_call__
 
-    class Color(object):
-        """ A color object which might be useful for *pygame*. """
-
-        color: dict[str, float]
-
-        def __init__(self, *args: float):
-            """ Creates a new color object with 4 values: ``r,g,b,a``. """
-
-            if type(args) is tuple:
-                if len(args) == 1:
-                    color_val = args[0] % 256
-                    self.color = {"r": color_val, "g": color_val, "b": color_val, "a": 256}
-                elif len(args) == 2:
-                    color_val = args[0] % 256
-                    alpha = args[1] % 256
-                    self.color = {"r": color_val, "g": color_val, "b": color_val, "a": alpha}
-                elif len(args) == 3:
-                    self.color = {"r": args[0] % 256, "g": args[1] % 256, "b": args[2] % 256, "a": 255}
-                elif len(args) == 4:
-                    self.color = {"r": args[0] % 256, "g": args[1] % 256, "b": args[2] % 256, "a": args[3] % 256}
-                else:
-                    raise Py5.Py5Error(f"Expected between 1 or 4 arguments. Got {len(args)} instead")
-
-        # readonly types
-        @property
-        def red(self) -> float:
-            """ Gets the red value. """
-            return self.color["r"]
-
-        @property
-        def green(self) -> float:
-            """ Gets the green value. """
-            return self.color["g"]
-
-        @property
-        def blue(self) -> float:
-            """ Gets the blue value. """
-            return self.color["b"]
-
-        @property
-        def alpha(self) -> float:
-            """ Gets the alpha value. """
-            return self.color["a"]
-
-        def get(self) -> dict[str, float]:
-            """ Returns the color object with all values. """
-            return self.color
-
-        def get_tuple(self) -> tuple[float, float, float, float]:
-            """ Returns the color object as a tuple with all values. """
-            return self.color["r"], self.color["g"], self.color["b"], self.color["a"]
-
     @staticmethod
     def color(*args: float) -> Color:
         """ Creates a new color object. """
@@ -600,19 +650,25 @@ class Py5:
 
             return Py5.Color(int(r, 16), int(g, 16), int(b, 16), int(a, 16))
         elif len(args) == 6:
-            r = args[0:1]
-            g = args[2:3]
-            b = args[4:5]
+            r = args[0:2]
+            g = args[2:4]
+            b = args[4:6]
 
             return Py5.Color(int(r, 16), int(g, 16), int(b, 16), 255)
         elif len(args) == 8:
-            r = args[0:1]
-            g = args[2:3]
-            b = args[4:5]
-            a = args[6:7]
+            r = args[0:2]
+            g = args[2:4]
+            b = args[4:6]
+            a = args[6:8]
 
             return Py5.Color(int(r, 16), int(g, 16), int(b, 16), int(a, 16))
 
+    @staticmethod
+    def colormap(*stops: Union[Color, str, tuple], size: int = 256) -> Py5Colormap:
+        """ Creates a scalar-to-color lookup table from gradient stops, see *Py5Colormap*. """
+        from Py5Colormap import Py5Colormap
+        return Py5Colormap(*stops, size=size)
+
     @staticmethod
     def fill_array(arr: list, value: any = None) -> list:
         """ Fills an array with the given values. """
@@ -650,10 +706,18 @@ class Py5:
     @staticmethod
     def available_methods(check: str = None) -> None:
         """ Prints the information for a function of this or one of it's subclasses. """
+        from Py5FileReader import Py5FileReader
+        from Py5Vector import Py5Vector
+
         py5_available = [
             "deg",
             "rad",
+            "context",
             "angle_mode",
+            "complex_mode",
+            "noise_detail",
+            "precision_mode",
+            "trig_table",
             "cos",
             "sin",
             "tan",
@@ -681,14 +745,18 @@ class Py5:
             "mag",
             "fact",
             "map",
+            "expression",
             "min",
             "nf",
             "num",
             "random",
             "choice",
+            "sampler",
             "noise",
             "create_vector",
+            "flow_field",
             "color",
+            "colormap",
             "fill_array",
             "includes",
             "available_methods"
@@ -701,8 +769,11 @@ class Py5:
             "get"
         ]
         py5filereader_available = [
+            "open",
             "parse",
-            "read"
+            "read",
+            "aggregate",
+            "follow"
         ]
         py5vector_available = [
             "add",
@@ -713,7 +784,14 @@ class Py5:
             "get"
         ]
         arrays_available = [
-            "fill"
+            "fill",
+            "arange",
+            "copy",
+            "assign",
+            "sum",
+            "min",
+            "max",
+            "sort"
         ]
 
         if check is None:
@@ -749,159 +827,3 @@ class Py5:
                 return
             print(f"Method '{check}' is part of 'Py5'")
             help(getattr(Py5, check))
-
-
-class Py5FileType(Enum):
-    """ The file extensions currently compatible with *Py5*. """
-
-    CONFIGURATION_SETTINGS = "ini"
-    TEXT = "txt"
-    XML = "xml"
-    EXCEL_SPREADSHEET = "csv"
-    MARKDOWN = "md"
-
-
-class Py5FileReader:
-    """ Allows the user to read and parse files. """
-
-    @staticmethod
-    def parse(file: str, ext: Py5FileType = Py5FileType.TEXT) -> \
-            Union[dict[str, Union[str, dict]], list[Union[str, dict]]]:
-        """
-        Parses code files such as xml and ini to a dictionary.
-        :raises Py5FileError If the file is not existing.
-        :param file: The path to the file.
-        :param ext: The file extension.
-        :return: The contents.
-        """
-        if not path.isfile(file):
-            raise Py5.Py5FileError(f"No such file, open '{file}'")
-        file = open(file, "r")
-        search = re.search
-        regex_match = re.match
-        if ext == Py5FileType.CONFIGURATION_SETTINGS:
-            value = {}
-            section = None
-            for line in file:
-                if search(r'^\s*([^=]+?)\s*=\s*(.*?)\s*$', line, re.M):
-                    match = regex_match(r'^\s*([^=]+?)\s*=\s*(.*?)\s*$', line, re.M)
-                    if section is not None:
-                        value[section][match[1]] = match[2]
-                    else:
-                        value[match[1]] = match[2]
-                elif search(r'^\s*\[\s*([^\]]*)\s*\]\s*$', line, re.M):
-                    match = regex_match(r'^\s*\[\s*([^\]]*)\s*\]\s*$', line, re.M)
-                    value[match[1]] = {}
-                    section = match[1]
-            return value
-        elif ext == Py5FileType.TEXT:
-            value = []
-            for line in file:
-                value.append(line.replace("\n", ""))
-            return value
-        elif ext == Py5FileType.XML:
-            values = {}
-            # Work in progress, adding in v0.5a
-            return values
-        elif ext == Py5FileType.MARKDOWN:
-            values = {}
-            compare = {
-                "h1": r"(?P<h1>^#)",
-                "h2": r"(?P<h2>^#{2})",
-                "h3": r"(?P<h3>^#{3})",
-                "h4": r"(?P<h4>^#{4})",
-                "i": r"[\*_]([^\*_]+)[\*_]$",
-                "b": r"[\*_]{2}([^\*_]+)[\*_]{2}$",
-                "strikethrough": r"~{2}([^~]+)~{2}$",
-                "code": r"`([^`]+)`$"
-            }
-
-    @staticmethod
-    def read(file: str, line: Optional[int] = None,
-             delimiter: str = "\n", ext: Union[str, Py5FileType] = Py5FileType.TEXT) -> Union[list[str], str]:
-
-        """
-        Reads the specified file and returns its content in a list form.
-        :raises Py5FileError If the specified file isn't existing.
-        :raises Py5Error If the line index is beyond the maximum lines of the file.
-        :raises Py5FileExtensionMismatchError If the given extension isn't compatible with the current version of Py5.
-        :param file: The path to the file.
-        :param line: Reads only specified line, **works only for text-type files**.
-        :param delimiter: Removes the end of the line if not specified, **works only for text-type files**.
-        :param ext: The file extension.
-        :return: The file contents.
-        """
-
-        def read_csv(csv: str) -> list[str]:
-            l: list[str] = []
-            csv = open(csv)
-            r = xls.reader(csv)
-            for csv_ln in r:
-                l.append(str(csv_ln))
-            csv.close()
-            return l
-
-        def read_xml(xml: str) -> list[str]:
-            l: list[str] = []
-            xml = open(xml)
-            for xml_ln in xml:
-                l.append(re.search(r"<([^>]+)>", xml_ln)[0])
-            xml.close()
-            return l
-
-        def read_md(md: str) -> list[str]:
-            l: list[str] = []
-            md = open(md)
-            for md_ln in md:
-                l.append(re.sub(r"^\s+", "", md_ln).strip("\n"))
-            md.close()
-            return l
-
-        def read_txt(txt: str, ln: Optional[int] = None, limiter: str = "\n") -> Union[str, list[str]]:
-            data: list[str] = []
-            f = open(txt)
-            current_line = 0
-            for f_ln in f:
-                current_line += 1
-                data.append(f_ln.strip(limiter).replace("\t", ""))
-                if ln is not None:
-                    if current_line == ln:
-                        return f_ln
-            if ln is not None:
-                if current_line < ln:
-                    raise Py5.Py5Error(f"Line number out of range.\nmaximum={current_line}; given={ln}")
-            f.close()
-            return data
-
-        def read_ini(ini: str) -> list[str]:
-            l: list[str] = []
-            ini = open(ini)
-            for ini_ln in ini:
-                l.append(ini_ln.strip("\n"))
-            ini.close()
-            return l
-
-        if not path.isfile(file):
-            raise Py5.Py5FileError(f"No such file, open '{file}'")
-
-        extension: str
-        if type(ext) is str:
-            extension = ext
-        else:
-            extension = ext.value
-
-        extension = extension.lower()
-
-        if extension == 'txt':
-            return read_txt(file, line, delimiter)
-        elif extension == 'csv':
-            return read_csv(file)
-        elif extension == 'xml':
-            return read_xml(file)
-        elif extension == 'md':
-            return read_md(file)
-        elif extension == 'ini':
-            return read_ini(file)
-        else:
-            error_msg = str(list(map(lambda x: x.name, Py5FileType.__members__.values()))).strip('[]')
-            raise Py5.Py5FileExtensionMismatchError(f"Expected one of {error_msg}, got '{extension}' instead.")
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import csv
+import math
+from collections import Counter
+from itertools import islice
+
+from Py5 import Py5
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import BinaryIO, Iterable, Iterator, Optional, Sequence
+
+# smallest byte range handed to a worker process, smaller files are not worth starting one
+MIN_RANGE_SIZE = 1 << 20
+# rows read before their values are added to the statistics in one batch
+BATCH_SIZE = 4096
+
+
+class Py5QuantileSketch(object):
+    """
+    Approximate quantiles in bounded memory, values are counted in logarithmic buckets (as in DDSketch).\n
+    Every quantile is within the relative 'accuracy' of an actual value as long as no buckets were collapsed, two
+    sketches with the same accuracy merge by adding their counts.
+    """
+
+    accuracy: float
+    max_buckets: int
+    count: int
+
+    def __init__(self, accuracy: float = 0.01, max_buckets: int = 2048):
+        """
+        :raises Py5ValueError If the accuracy is not between 0 and 1.
+        :param accuracy: The relative error of the quantiles, e.g. 0.01 for 1%.
+        :param max_buckets: The buckets kept per sign, the smallest magnitudes are collapsed beyond it.
+        """
+        if not 0.0 < accuracy < 1.0:
+            raise Py5.Py5ValueError(f"Expected an accuracy between 0 and 1, got {accuracy} instead")
+        self.accuracy = accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self.__gamma__ = (1.0 + accuracy) / (1.0 - accuracy)
+        self.__log_gamma__ = math.log(self.__gamma__)
+        self.__zeros__ = 0
+        # bucket index -> count, for the magnitudes of positive and negative values
+        self.__positive__ = {}
+        self.__negative__ = {}
+
+    def update(self, values: Iterable[float]) -> None:
+        """ Adds every value to the sketch. """
+        values = list(values)
+        positive = [v for v in values if v > 1e-300]
+        negative = [-v for v in values if v < -1e-300]
+        self.__zeros__ += len(values) - len(positive) - len(negative)
+        self.count += len(values)
+        scale = 1.0 / self.__log_gamma__
+        for magnitudes, buckets in ((positive, self.__positive__), (negative, self.__negative__)):
+            if not magnitudes:
+                continue
+            for i, n in Counter(map(math.ceil, map(scale.__mul__, map(math.log, magnitudes)))).items():
+                buckets[i] = buckets.get(i, 0) + n
+            self.__collapse__(buckets)
+
+    def __collapse__(self, buckets: dict[int, int]) -> None:
+        if len(buckets) <= self.max_buckets:
+            return
+        keys = sorted(buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        buckets[target] += sum(buckets.pop(k) for k in keys[:excess])
+
+    def merge(self, other: 'Py5QuantileSketch') -> None:
+        """
+        Adds the counts of another sketch.
+        :raises Py5ValueError If the sketches have a different accuracy.
+        """
+        if other.accuracy != self.accuracy:
+            raise Py5.Py5ValueError(f"Expected a sketch of accuracy {self.accuracy}, got {other.accuracy} instead")
+        for own, others in ((self.__positive__, other.__positive__), (self.__negative__, other.__negative__)):
+            for i, n in others.items():
+                own[i] = own.get(i, 0) + n
+            self.__collapse__(own)
+        self.__zeros__ += other.__zeros__
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the approximate 'q' quantile, e.g. 0.5 for the median, or None if the sketch is empty.
+        :raises Py5ValueError If 'q' is not between 0 and 1.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise Py5.Py5ValueError(f"Expected a quantile between 0 and 1, got {q} instead")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for i in sorted(self.__negative__, reverse=True):
+            seen += self.__negative__[i]
+            if seen > rank:
+                return -self.__value__(i)
+        seen += self.__zeros__
+        if seen > rank:
+            return 0.0
+        for i in sorted(self.__positive__):
+            seen += self.__positive__[i]
+            if seen > rank:
+                return self.__value__(i)
+        return self.__value__(max(self.__positive__))
+
+    def __value__(self, i: int) -> float:
+        # the point of bucket (gamma ** (i - 1), gamma ** i] with the same relative error to both ends
+        return 2.0 * self.__gamma__ ** i / (self.__gamma__ + 1.0)
+
+
+class Py5ColumnStats(object):
+    """
+    Count, sum, min, max, mean, variance and approximate quantiles of a numeric column, updated in one pass with
+    constant memory. Mean and variance follow Welford, partial results merge with the formula of Chan et al.
+    """
+
+    count: int
+    # cells which were empty or not a number
+    missing: int
+    sum: float
+    min: Optional[float]
+    max: Optional[float]
+    mean: float
+    sketch: Py5QuantileSketch
+
+    def __init__(self, accuracy: float = 0.01):
+        """ :param accuracy: The relative error of the quantiles, see *Py5QuantileSketch*. """
+        self.count = 0
+        self.missing = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self.mean = 0.0
+        # sum of squared differences from the mean
+        self.__m2__ = 0.0
+        self.sketch = Py5QuantileSketch(accuracy)
+
+    def update(self, values: Sequence[float]) -> None:
+        """ Adds a batch of values. """
+        if not values:
+            return
+        count = self.count
+        mean = self.mean
+        m2 = self.__m2__
+        for v in values:
+            count += 1
+            delta = v - mean
+            mean += delta / count
+            m2 += delta * (v - mean)
+        self.count = count
+        self.mean = mean
+        self.__m2__ = m2
+        self.sum += math.fsum(values)
+        low = min(values)
+        high = max(values)
+        self.min = low if self.min is None or low < self.min else self.min
+        self.max = high if self.max is None or high > self.max else self.max
+        self.sketch.update(values)
+
+    def merge(self, other: 'Py5ColumnStats') -> None:
+        """ Adds the values of another partial result, as if they had been added to this one. """
+        self.missing += other.missing
+        if not other.count:
+            return
+        if not self.count:
+            self.min, self.max = other.min, other.max
+        else:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.__m2__ += other.__m2__ + delta * delta * self.count * other.count / count
+        self.count = count
+        self.sum += other.sum
+        self.sketch.merge(other.sketch)
+
+    @property
+    def variance(self) -> float:
+        """ Gets the population variance, 0 for less than two values. """
+        return self.__m2__ / self.count if self.count > 1 else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        """ Gets the sample variance, 0 for less than two values. """
+        return self.__m2__ / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """ Gets the population standard deviation. """
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """ Returns the approximate 'q' quantile clamped to the exact min and max, None without values. """
+        value = self.sketch.quantile(q)
+        if value is None:
+            return None
+        return min(max(value, self.min), self.max)
+
+    def __repr__(self) -> str:
+        return f"Py5ColumnStats(count={self.count}, min={self.min}, max={self.max}, mean={self.mean}, " \
+               f"stdev={self.stdev}, median={self.quantile(0.5)})"
+
+
+def range_lines(f: BinaryIO, start: int, end: int, encoding: str) -> Iterator[str]:
+    """
+    Yields the lines which start between the byte offsets 'start' and 'end', a line crossing 'start' is left to the
+    previous range.
+    """
+    if start:
+        f.seek(start - 1)
+        f.readline()
+    position = f.tell()
+    while position < end:
+        line = f.readline()
+        if not line:
+            return
+        position += len(line)
+        yield line.decode(encoding)
+
+
+def aggregate_lines(lines: Iterable[str], columns: Sequence[int], delimiter: Optional[str],
+                    accuracy: float) -> list[Py5ColumnStats]:
+    """
+    Aggregates the given columns of delimited lines, split on whitespace if the delimiter is None.
+    Cells which are empty, missing or not a finite number are counted as missing, blank lines are skipped.
+    """
+    stats = [Py5ColumnStats(accuracy) for _ in columns]
+    rows = map(str.split, lines) if delimiter is None else csv.reader(lines, delimiter=delimiter)
+    # blank lines give empty rows, they are no values at all rather than missing ones
+    rows = filter(None, rows)
+    isfinite = math.isfinite
+    while True:
+        batch = list(islice(rows, BATCH_SIZE))
+        if not batch:
+            return stats
+        for column, result in zip(columns, stats):
+            # the whole batch is converted at once unless a cell is missing or not a number
+            try:
+                values = list(map(float, [row[column] for row in batch]))
+            except (IndexError, ValueError):
+                values = [parse_float(row, column) for row in batch]
+            finite = [v for v in values if v is not None and isfinite(v)]
+            result.missing += len(batch) - len(finite)
+            result.update(finite)
+
+
+def parse_float(row: Sequence[str], column: int) -> Optional[float]:
+    """ Returns the cell as a number, None if it is missing or not a number. """
+    try:
+        return float(row[column])
+    except (IndexError, ValueError):
+        return None
+
+
+def aggregate_range(file: str, start: int, end: int, columns: Sequence[int], delimiter: Optional[str],
+                    skip: int, encoding: str, accuracy: float) -> list[Py5ColumnStats]:
+    """ Aggregates the lines of one byte range, run by the worker processes. The first range skips 'skip' lines. """
+    with open(file, "rb") as f:
+        lines = range_lines(f, start, end, encoding)
+        for _ in range(skip if not start else 0):
+            next(lines, None)
+        return aggregate_lines(lines, columns, delimiter, accuracy)
@@ -0,0 +1,54 @@
+from Py5 import Py5
+
+
+class Color(object):
+    """ A color object which might be useful for *pygame*. """
+
+    color: dict[str, float]
+
+    def __init__(self, *args: float):
+        """ Creates a new color object with 4 values: ``r,g,b,a``. """
+
+        if type(args) is tuple:
+            if len(args) == 1:
+                color_val = args[0] % 256
+                self.color = {"r": color_val, "g": color_val, "b": color_val, "a": 256}
+            elif len(args) == 2:
+                color_val = args[0] % 256
+                alpha = args[1] % 256
+                self.color = {"r": color_val, "g": color_val, "b": color_val, "a": alpha}
+            elif len(args) == 3:
+                self.color = {"r": args[0] % 256, "g": args[1] % 256, "b": args[2] % 256, "a": 255}
+            elif len(args) == 4:
+                self.color = {"r": args[0] % 256, "g": args[1] % 256, "b": args[2] % 256, "a": args[3] % 256}
+            else:
+                raise Py5.Py5Error(f"Expected between 1 or 4 arguments. Got {len(args)} instead")
+
+    # readonly types
+    @property
+    def red(self) -> float:
+        """ Gets the red value. """
+        return self.color["r"]
+
+    @property
+    def green(self) -> float:
+        """ Gets the green value. """
+        return self.color["g"]
+
+    @property
+    def blue(self) -> float:
+        """ Gets the blue value. """
+        return self.color["b"]
+
+    @property
+    def alpha(self) -> float:
+        """ Gets the alpha value. """
+        return self.color["a"]
+
+    def get(self) -> dict[str, float]:
+        """ Returns the color object with all values. """
+        return self.color
+
+    def get_tuple(self) -> tuple[float, float, float, float]:
+        """ Returns the color object as a tuple with all values. """
+        return self.color["r"], self.color["g"], self.color["b"], self.color["a"]
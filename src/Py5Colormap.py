@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from Py5 import Py5
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Optional, Sequence, Union
+
+    from Py5Color import Color
+
+
+class Py5Colormap(object):
+    """
+    A lookup table which turns scalar values into packed RGBA bytes, built once from gradient stops.\n
+    ``Py5Colormap("#000", "#f80", "#fff").apply(values)`` maps a whole float array (e.g. noise values) to a
+    *bytearray* of ``len(values) * 4`` bytes in one pass, ready to blit or to write to disk.
+    """
+
+    size: int
+    # size * 4 bytes, entry k is the color at position k / (size - 1)
+    table: bytes
+
+    def __init__(self, *stops: Union[Color, str, Sequence[float], tuple[float, Union[Color, str, Sequence[float]]]],
+                 size: int = 256):
+        """
+        Creates the colormap from at least two stops.
+        :raises Py5ValueError If less than two stops or less than two entries are given.
+        :param stops: Colors as *Py5.Color*, hex strings or (r, g, b[, a]) tuples, spread evenly from 0 to 1.
+         Use (position, color) pairs to place them yourself, positions have to increase from 0 to 1.
+        :param size: The amount of table entries, e.g. 256 or 4096.
+        """
+        if len(stops) < 2:
+            raise Py5.Py5ValueError(f"Expected at least 2 stops, got {len(stops)} instead")
+        if size < 2:
+            raise Py5.Py5ValueError(f"Expected at least 2 table entries, got {size} instead")
+        self.size = size
+
+        if all(type(stop) is tuple and len(stop) == 2 for stop in stops):
+            positions = [float(position) for position, _ in stops]
+            colors = [Py5Colormap.__rgba__(color) for _, color in stops]
+        else:
+            positions = [k / (len(stops) - 1) for k in range(len(stops))]
+            colors = [Py5Colormap.__rgba__(color) for color in stops]
+
+        table = bytearray(size * 4)
+        stop = 0
+        for k in range(size):
+            t = k / (size - 1)
+            while stop < len(positions) - 2 and t > positions[stop + 1]:
+                stop += 1
+            start, end = positions[stop], positions[stop + 1]
+            f = Py5.constrain((t - start) / (end - start) if end > start else 1.0, 0.0, 1.0)
+            a, b = colors[stop], colors[stop + 1]
+            table[k * 4:k * 4 + 4] = bytes(int(a[c] + f * (b[c] - a[c]) + 0.5) for c in range(4))
+        self.table = bytes(table)
+        self.__entries__ = [self.table[k:k + 4] for k in range(0, size * 4, 4)]
+
+    @staticmethod
+    def __rgba__(color: Union[Color, str, Sequence[float]]) -> tuple[int, int, int, int]:
+        if type(color) is str:
+            color = Py5.hex_color(color)
+        rgba = tuple(color.get_tuple()) if hasattr(color, "get_tuple") else tuple(color)
+        if len(rgba) == 3:
+            rgba += (255,)
+        return tuple(min(max(int(channel), 0), 255) for channel in rgba)
+
+    def indices(self, values: Iterable[float], low: float = 0.0, high: float = 1.0) -> list[int]:
+        """ Returns the table entry of every value, 'low' maps to the first and 'high' to the last one. """
+        last = self.size - 1
+        scale = last / (high - low)
+        return [0 if i < 0 else last if i > last else i for i in
+                map(int, map((0.5 - low * scale).__add__, map(scale.__mul__, values)))]
+
+    def apply(self, values: Iterable[float], low: float = 0.0, high: float = 1.0,
+              out: Optional[Union[bytearray, memoryview]] = None) -> Union[bytearray, memoryview]:
+        """
+        Maps every value to its color and packs them as RGBA bytes.
+        :raises ValueError If 'out' does not have 4 bytes per value.
+        :param values: The scalar values, e.g. from *Py5.noise*.
+        :param low: The value of the first color, smaller values are clamped.
+        :param high: The value of the last color, larger values are clamped.
+        :param out: A buffer of ``len(values) * 4`` bytes to reuse, e.g. a pixel buffer.
+        :return: 'out', or a new *bytearray*.
+        """
+        packed = b"".join(map(self.__entries__.__getitem__, self.indices(values, low, high)))
+        if out is None:
+            return bytearray(packed)
+        if len(out) != len(packed):
+            raise ValueError(f"Expected an output buffer of {len(packed)} bytes, got {len(out)} instead")
+        out[:] = packed
+        return out
+
+    def color(self, value: float, low: float = 0.0, high: float = 1.0) -> Color:
+        """ Returns the color of a single value as a *Py5.Color*. """
+        entry = self.__entries__[self.indices((value,), low, high)[0]]
+        return Py5.Color(*entry)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import math
+from contextvars import ContextVar
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Union
+
+    from Py5Types import MODE, COMPLEX
+
+PI = math.pi
+
+
+class Py5Context(object):
+    """
+    The math settings of *Py5*: angle mode, complex mode and noise detail.\n
+    Every thread and asyncio task reads its own current context, so workers can use different modes side by side
+    without a lock. Use it as ``with Py5Context(Py5.MODE.DEGREES): ...`` to make it current for a block, or call its
+    methods directly, which reads no shared state at all. Contexts are not changed after creation, use
+    :meth:`replace` to derive a new one.
+    """
+
+    __slots__ = ("degrees", "complex", "noise_octaves", "noise_falloff")
+
+    degrees: bool
+    complex: bool
+    noise_octaves: int
+    noise_falloff: float
+
+    def __init__(self, mode: MODE = None, cx: COMPLEX = None, noise_octaves: int = 4, noise_falloff: float = 0.5):
+        """
+        Creates new math settings.
+        :param mode: MODE.DEGREES or MODE.RADIANS, default is MODE.RADIANS.
+        :param cx: COMPLEX.COMPLEX or COMPLEX.SIMPLE, default is COMPLEX.SIMPLE.
+        :param noise_octaves: The amount of octaves summed up by *noise*.
+        :param noise_falloff: The factor each octave is weighted with compared to the previous one.
+        """
+        self.degrees = mode is not None and mode.value
+        self.complex = cx is not None and cx.value
+        self.noise_octaves = noise_octaves
+        self.noise_falloff = noise_falloff
+
+    @property
+    def mode(self) -> MODE:
+        """ Gets the angle mode. """
+        from Py5Types import MODE
+        return MODE.DEGREES if self.degrees else MODE.RADIANS
+
+    @property
+    def cx(self) -> COMPLEX:
+        """ Gets the complex mode. """
+        from Py5Types import COMPLEX
+        return COMPLEX.COMPLEX if self.complex else COMPLEX.SIMPLE
+
+    def replace(self, mode: MODE = None, cx: COMPLEX = None, noise_octaves: int = None,
+                noise_falloff: float = None) -> 'Py5Context':
+        """ Returns a copy of this context with the given settings changed. """
+        return Py5Context(self.mode if mode is None else mode,
+                          self.cx if cx is None else cx,
+                          self.noise_octaves if noise_octaves is None else noise_octaves,
+                          self.noise_falloff if noise_falloff is None else noise_falloff)
+
+    def __enter__(self) -> 'Py5Context':
+        # the tokens live in the running thread or task, so one context can be entered by several at once
+        ENTERED_TOKENS.set(ENTERED_TOKENS.get() + (CURRENT_CONTEXT.set(self),))
+        return self
+
+    def __exit__(self, *args) -> None:
+        tokens = ENTERED_TOKENS.get()
+        CURRENT_CONTEXT.reset(tokens[-1])
+        ENTERED_TOKENS.set(tokens[:-1])
+
+    def __repr__(self) -> str:
+        return f"Py5Context({self.mode}, {self.cx}, noise_octaves={self.noise_octaves}, " \
+               f"noise_falloff={self.noise_falloff})"
+
+    def cos(self, n: float) -> float:
+        """ Returns the cosine of the given value 'n' """
+        return math.cos(n * PI / 180) if self.degrees else math.cos(n)
+
+    def sin(self, n: float) -> float:
+        """ Returns the sine of the given value 'n'. """
+        return math.sin(n * PI / 180) if self.degrees else math.sin(n)
+
+    def tan(self, n: float) -> float:
+        """ Returns the tangent of the given value 'n'. """
+        return math.tan(n * PI / 180) if self.degrees else math.tan(n)
+
+    def asin(self, n: float) -> float:
+        """ Returns the arc sine of 'n'. """
+        return math.asin(n * PI / 180) if self.degrees else math.asin(n)
+
+    def acos(self, n: float) -> float:
+        """ Returns the arc cosine of 'n'. """
+        return math.acos(n * PI / 180) if self.degrees else math.acos(n)
+
+    def atan(self, n: float) -> float:
+        """ Returns the arc tangent of 'n'. """
+        return math.atan(n * PI / 180) if self.degrees else math.atan(n)
+
+    def sinh(self, n: float) -> float:
+        """ Returns the hyperbolic sine of 'n'. """
+        return math.sinh(n * PI / 180) if self.degrees else math.sinh(n)
+
+    def cosh(self, n: float) -> float:
+        """ Returns the hyperbolic cosine of 'n'. """
+        return math.cosh(n * PI / 180) if self.degrees else math.cosh(n)
+
+    def tanh(self, n: float) -> float:
+        """ Returns the hyperbolic tangent of 'n'. """
+        return math.tanh(n * PI / 180) if self.degrees else math.tanh(n)
+
+    def asinh(self, n: float) -> float:
+        """ Returns the inverse hyperbolic sine of 'n'. """
+        return math.asinh(n * PI / 180) if self.degrees else math.asinh(n)
+
+    def acosh(self, n: float) -> float:
+        """ Returns the inverse hyperbolic cosine of 'n'. """
+        return math.acosh(n * PI / 180) if self.degrees else math.acosh(n)
+
+    def atanh(self, n: float) -> float:
+        """ Returns the inverse hyperbolic tangent of 'n'. """
+        return math.atanh(n * PI / 180) if self.degrees else math.atanh(n)
+
+    def atan2(self, x: float, y: float) -> float:
+        """ Returns the arc tangent of x/y, """
+        return math.atan2(x * PI / 180, y * PI / 180) if self.degrees else math.atan2(x, y)
+
+    def sqrt(self, x: Union[float, int]) -> Union[float, str]:
+        """ Returns the square root of x. """
+        if type(x) is int:
+            x = float(x)
+        if not self.complex:
+            return math.sqrt(x)
+        else:
+            res = float(math.sqrt(abs(x)))
+            if x < 0:
+                res = str(res) + ' * i'
+            return res
+
+    def root(self, x: Union[float, int], n: int) -> Union[float, str]:
+        """
+        Returns the nth root of x.
+        :param x Base
+        :param n Denominator, exponent
+        """
+        if n == 2:
+            return self.sqrt(x)
+        else:
+            res = x**n
+            if not self.complex:
+                return res
+            else:
+                return str(float(abs(x)**float(1/n))) + " * i"
+
+
+# the context of the running thread or task, new threads start with the default settings
+CURRENT_CONTEXT: ContextVar[Py5Context] = ContextVar("Py5Context", default=Py5Context())
+ENTERED_TOKENS: ContextVar[tuple] = ContextVar("Py5ContextTokens", default=())
@@ -0,0 +1,18 @@
+from datetime import datetime as dt
+
+
+class Debug(object):
+    def __init__(self, func):
+        self.func = func
+
+    def __log_call__(self, *args, **kwargs) -> any:
+        _now = dt.now()
+        _hour: str = _now.hour if _now.hour > 10 else f"0{_now.hour}"
+        _minute: str = _now.minute if _now.minute > 10 else f"0{_now.minute}"
+        _second: str = _now.second if _now.second > 10 else f"0{_now.second}"
+
+        print(f"{_hour}:{_minute}:{_second}: Executed: {self.func.__name__}"
+              f"\n\tArguments: {args}"
+              f"\n\tNamed Arguments: {kwargs}")
+
+        return self.func(*args, **kwargs)
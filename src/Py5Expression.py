@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import math
+from array import array
+
+from Py5 import Py5
+from Py5Context import CURRENT_CONTEXT
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Sequence, Union
+
+# op -> statement template, 'x' is the current value and c0, c1, ... are the constants of the op
+TEMPLATES = {
+    "map": "x = max(min((x + {0}) / {1} * {2} + {3}, {4}), {5})",
+    "constrain": "x = max(min(x, {1}), {0})",
+    "lerp": "x = x * {1} + {0}",
+    "abs": "x = -x if x < 0 else x",
+    "pow": "x = x ** {0}",
+    "exp": "x = E ** x",
+    "half": "x = 0.5 * x",
+    "double": "x = 2 * x",
+    "deg": "x = x * 180 / PI",
+    "rad": "x = x * PI / 180",
+    "floor": "x = int(x)",
+    "ceil": "x = int(x) + 1",
+}
+TRIG = ("sin", "cos", "tan")
+
+
+class Py5Expression(object):
+    """
+    A lazy chain of *Py5* math functions which is compiled into one loop and evaluated over whole arrays.\n
+    ``Py5.expression().map(0, 1, -1, 1).constrain(-0.5, 0.5).lerp(0, Py5.TWO_PI).sin().evaluate(values)``\n
+    Every element passes through all steps in a single pass without intermediate arrays or objects, the results are
+    the same as composing the scalar functions. Trigonometric steps follow the angle mode and the precision mode
+    which are active when :meth:`evaluate` is called.
+    """
+
+    ops: tuple[tuple[str, tuple], ...]
+
+    def __init__(self, ops: tuple[tuple[str, tuple], ...] = ()):
+        self.ops = ops
+        # (degrees, trig table) -> compiled loop
+        self.__compiled__ = {}
+
+    def __then__(self, op: str, *args: float) -> 'Py5Expression':
+        return Py5Expression(self.ops + ((op, args),))
+
+    def map(self, start1: float, stop1: float, start2: float, stop2: float) -> 'Py5Expression':
+        """ Adds *Py5.map* with the value as 'n'. """
+        low, high = (start2, stop2) if start2 < stop2 else (stop2, start2)
+        return self.__then__("map", start1, stop1 - start1, stop2 - start2, start2, high, low)
+
+    def constrain(self, low: float, high: float) -> 'Py5Expression':
+        """ Adds *Py5.constrain* with the value as 'n'. """
+        return self.__then__("constrain", low, high)
+
+    def lerp(self, start: float, stop: float) -> 'Py5Expression':
+        """ Adds *Py5.lerp* with the value as 'amount'. """
+        return self.__then__("lerp", start, stop - start)
+
+    def sin(self) -> 'Py5Expression':
+        """ Adds *Py5.sin*. """
+        return self.__then__("sin")
+
+    def cos(self) -> 'Py5Expression':
+        """ Adds *Py5.cos*. """
+        return self.__then__("cos")
+
+    def tan(self) -> 'Py5Expression':
+        """ Adds *Py5.tan*. """
+        return self.__then__("tan")
+
+    def abs(self) -> 'Py5Expression':
+        """ Adds *Py5.abs*. """
+        return self.__then__("abs")
+
+    def pow(self, n: Union[float, int]) -> 'Py5Expression':
+        """ Adds *Py5.pow* with the value as 'x'. """
+        return self.__then__("pow", n)
+
+    def exp(self) -> 'Py5Expression':
+        """ Adds *Py5.exp*. """
+        return self.__then__("exp")
+
+    def half(self) -> 'Py5Expression':
+        """ Adds *Py5.half*. """
+        return self.__then__("half")
+
+    def double(self) -> 'Py5Expression':
+        """ Adds *Py5.double*. """
+        return self.__then__("double")
+
+    def deg(self) -> 'Py5Expression':
+        """ Adds *Py5.deg*. """
+        return self.__then__("deg")
+
+    def rad(self) -> 'Py5Expression':
+        """ Adds *Py5.rad*. """
+        return self.__then__("rad")
+
+    def floor(self) -> 'Py5Expression':
+        """ Adds *Py5.floor*. """
+        return self.__then__("floor")
+
+    def ceil(self) -> 'Py5Expression':
+        """ Adds *Py5.ceil*. """
+        return self.__then__("ceil")
+
+    def __compile__(self):
+        degrees = CURRENT_CONTEXT.get().degrees
+        table = Py5.__trig_table__
+        key = (degrees, table)
+        if key in self.__compiled__:
+            return self.__compiled__[key]
+
+        namespace = {"max": max, "min": min, "int": int, "PI": Py5.PI, "E": Py5.E}
+        for name in TRIG:
+            namespace[name] = getattr(table, name) if table is not None and name != "tan" else getattr(math, name)
+
+        statements = []
+        constants = 0
+        for op, args in self.ops:
+            names = []
+            for arg in args:
+                names.append(f"c{constants}")
+                namespace[names[-1]] = arg
+                constants += 1
+            if op in TRIG:
+                statements.append(f"x = {op}(x * PI / 180)" if degrees else f"x = {op}(x)")
+            else:
+                statements.append(TEMPLATES[op].format(*names))
+
+        source = "def scalar(x):\n"
+        source += "".join(f"    {statement}\n" for statement in statements)
+        source += "    return x\n"
+        source += "def fused(values, out):\n    i = 0\n    for x in values:\n"
+        source += "".join(f"        {statement}\n" for statement in statements)
+        source += "        out[i] = x\n        i += 1\n    return out\n"
+        exec(compile(source, "<Py5Expression>", "exec"), namespace)
+        self.__compiled__[key] = (namespace["scalar"], namespace["fused"])
+        return self.__compiled__[key]
+
+    def __call__(self, x: float) -> float:
+        """ Evaluates the chain for a single value. """
+        return self.__compile__()[0](x)
+
+    def evaluate(self, values: Sequence[float], out: Optional[Union[array, list, memoryview]] = None) \
+            -> Union[array, list, memoryview]:
+        """
+        Evaluates the chain for every value in one pass.
+        :raises ValueError If 'out' is shorter than 'values'.
+        :param values: The input values, any sized sequence or buffer.
+        :param out: The buffer the results are written to, reuse it between calls or pass 'values' to work in place.
+        :return: 'out', or a new *array('d')* if not given.
+        """
+        if out is None:
+            out = array("d", bytes(8 * len(values)))
+        elif len(out) < len(values):
+            raise ValueError(f"Expected an output buffer of at least {len(values)} values, got {len(out)} instead")
+        return self.__compile__()[1](values, out)
@@ -0,0 +1,448 @@
+import csv as xls
+import io
+import os
+import queue
+import re
+import threading
+import time
+from enum import Enum
+from importlib import import_module
+from os import path
+from types import ModuleType
+from typing import AsyncIterator, IO, Iterator, Sequence, Union, Optional
+
+from Py5 import Py5
+
+
+# magic bytes -> module with a compatible open()
+COMPRESSION_MAGIC = {
+    b"\x1f\x8b": "gzip",
+    # "BZh", the block size 1-9 and the magic of the first block, or of the stream end if the file is empty
+    **{b"BZh%d%s" % (level, block): "bz2" for level in range(1, 10) for block in (b"1AY&SY", b"\x17rE8P\x90")},
+    b"\xfd7zXZ\x00": "lzma",
+}
+# bytes read to detect the compression, the longest magic
+COMPRESSION_MAGIC_SIZE = max(map(len, COMPRESSION_MAGIC))
+
+
+class Py5FileType(Enum):
+    """ The file extensions currently compatible with *Py5*. """
+
+    CONFIGURATION_SETTINGS = "ini"
+    TEXT = "txt"
+    XML = "xml"
+    EXCEL_SPREADSHEET = "csv"
+    MARKDOWN = "md"
+
+
+class Py5FileReader:
+    """ Allows the user to read and parse files. """
+
+    @staticmethod
+    def open(file: str, background: bool = False, encoding: Optional[str] = None) -> IO[str]:
+        """
+        Opens a file for reading text, *.gz*, *.bz2* and *.xz* files are detected by their magic bytes and
+        decompressed while they are read, no temporary file is created.
+        :param file: The path to the file.
+        :param background: Decompresses on a background thread, ahead of the parsing in the calling thread.
+        :param encoding: The text encoding, the locale default if not given.
+        :return: The text stream, close it when done.
+        """
+        compression = Py5FileReader.__compression__(file)
+        if compression is None:
+            return open(file, encoding=encoding)
+        if not background:
+            return compression.open(file, "rt", encoding=encoding)
+        return io.TextIOWrapper(io.BufferedReader(Py5BackgroundReader(compression.open(file, "rb"))),
+                                encoding=encoding)
+
+    @staticmethod
+    def __compression__(file: str) -> Optional[ModuleType]:
+        """ Returns the module which decompresses the file (gzip, bz2 or lzma), None if it is not compressed. """
+        with open(file, "rb") as f:
+            magic = f.read(COMPRESSION_MAGIC_SIZE)
+        for prefix, module in COMPRESSION_MAGIC.items():
+            if magic.startswith(prefix):
+                return import_module(module)
+        return None
+
+    # absolute path -> follower, keeps the offset of every followed file between calls
+    __followers__: dict[str, 'Py5FileFollower'] = {}
+
+    @staticmethod
+    def follow(file: str, from_start: bool = False) -> 'Py5FileFollower':
+        """
+        Returns the follower of a growing file such as a log, the same one for every call with the same path.
+
+        ``Py5FileReader.follow("app.log").poll()`` returns only the lines appended since the previous poll.
+        :raises Py5FileError If the file is not existing when it is followed for the first time.
+        :param file: The path to the file.
+        :param from_start: Starts with the existing lines instead of the end of the file, only on the first call.
+        """
+        key = path.abspath(file)
+        if key not in Py5FileReader.__followers__:
+            Py5FileReader.__followers__[key] = Py5FileFollower(key, from_start)
+        return Py5FileReader.__followers__[key]
+
+    @staticmethod
+    def parse(file: str, ext: Py5FileType = Py5FileType.TEXT, background: bool = False) -> \
+            Union[dict[str, Union[str, dict]], list[Union[str, dict]]]:
+        """
+        Parses code files such as xml and ini to a dictionary, compressed files are decompressed on the fly.
+        :raises Py5FileError If the file is not existing.
+        :param file: The path to the file.
+        :param ext: The file extension.
+        :param background: Decompresses on a background thread, see *open*.
+        :return: The contents.
+        """
+        if not path.isfile(file):
+            raise Py5.Py5FileError(f"No such file, open '{file}'")
+        if ext == Py5FileType.MARKDOWN:
+            # blocks as dictionaries, cached per file until it changes
+            from Py5Markdown import Py5Markdown
+            return Py5Markdown.parse(file, background)
+        file = Py5FileReader.open(file, background)
+        search = re.search
+        regex_match = re.match
+        if ext == Py5FileType.CONFIGURATION_SETTINGS:
+            value = {}
+            section = None
+            for line in file:
+                if search(r'^\s*([^=]+?)\s*=\s*(.*?)\s*$', line, re.M):
+                    match = regex_match(r'^\s*([^=]+?)\s*=\s*(.*?)\s*$', line, re.M)
+                    if section is not None:
+                        value[section][match[1]] = match[2]
+                    else:
+                        value[match[1]] = match[2]
+                elif search(r'^\s*\[\s*([^\]]*)\s*\]\s*$', line, re.M):
+                    match = regex_match(r'^\s*\[\s*([^\]]*)\s*\]\s*$', line, re.M)
+                    value[match[1]] = {}
+                    section = match[1]
+            return value
+        elif ext == Py5FileType.TEXT:
+            value = []
+            for line in file:
+                value.append(line.replace("\n", ""))
+            return value
+        elif ext == Py5FileType.XML:
+            values = {}
+            # Work in progress, adding in v0.5a
+            return values
+
+    @staticmethod
+    def aggregate(file: str, columns: Sequence[Union[int, str]] = (0,), delimiter: Optional[str] = ",",
+                  header: bool = False, workers: int = 1, accuracy: float = 0.01,
+                  encoding: str = "utf-8") -> dict[Union[int, str], 'Py5ColumnStats']:
+        """
+        Computes count, sum, min, max, mean, variance and approximate quantiles of numeric CSV or TXT columns in one
+        streaming pass, the rows are never held in memory.\n
+        ``Py5FileReader.aggregate("data.csv", ["price"], header=True, workers=4)["price"].quantile(0.99)``
+        :raises Py5FileError If the file is not existing.
+        :raises Py5ValueError If a column is neither an index nor a name of the header.
+        :param file: The path to the file, compressed files are read by one process.
+        :param columns: The column indices, or names if the file has a header.
+        :param delimiter: The CSV delimiter, None splits the lines on whitespace like TXT tables.
+        :param header: Whether the first line holds the column names.
+        :param workers: Splits the file into byte ranges aggregated by this many processes and merges the results,
+         ranges are at least 1 MiB. Quoted cells must not contain line breaks then.
+        :param accuracy: The relative error of the quantiles.
+        :param encoding: The text encoding.
+        :return: The statistics of every column, keyed like 'columns'.
+        """
+        from Py5Aggregate import MIN_RANGE_SIZE, aggregate_lines, aggregate_range
+
+        if not path.isfile(file):
+            raise Py5.Py5FileError(f"No such file, open '{file}'")
+        names = []
+        if header:
+            with Py5FileReader.open(file, encoding=encoding) as f:
+                first = f.readline().rstrip("\r\n")
+            names = first.split() if delimiter is None else next(xls.reader([first], delimiter=delimiter), [])
+        indices = []
+        for column in columns:
+            if type(column) is int:
+                indices.append(column)
+            elif column in names:
+                indices.append(names.index(column))
+            else:
+                raise Py5.Py5ValueError(f"Expected a column index or a name of the header, got '{column}' instead")
+
+        size = path.getsize(file)
+        workers = max(1, min(workers, size // MIN_RANGE_SIZE))
+        if workers == 1 or Py5FileReader.__compression__(file) is not None:
+            with Py5FileReader.open(file, encoding=encoding) as f:
+                if header:
+                    f.readline()
+                results = aggregate_lines(f, indices, delimiter, accuracy)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            bounds = [size * k // workers for k in range(workers + 1)]
+            with ProcessPoolExecutor(workers) as pool:
+                partials = list(pool.map(aggregate_range, [file] * workers, bounds, bounds[1:], [indices] * workers,
+                                         [delimiter] * workers, [int(header)] * workers, [encoding] * workers,
+                                         [accuracy] * workers))
+            results = partials[0]
+            for partial in partials[1:]:
+                for total, part in zip(results, partial):
+                    total.merge(part)
+        return dict(zip(columns, results))
+
+    @staticmethod
+    def read(file: str, line: Optional[int] = None,
+             delimiter: str = "\n", ext: Union[str, Py5FileType] = Py5FileType.TEXT,
+             background: bool = False) -> Union[list[str], str]:
+
+        """
+        Reads the specified file and returns its content in a list form, compressed files are decompressed on the fly.
+        :raises Py5FileError If the specified file isn't existing.
+        :raises Py5Error If the line index is beyond the maximum lines of the file.
+        :raises Py5FileExtensionMismatchError If the given extension isn't compatible with the current version of Py5.
+        :param file: The path to the file.
+        :param line: Reads only specified line, **works only for text-type files**.
+        :param delimiter: Removes the end of the line if not specified, **works only for text-type files**.
+        :param ext: The file extension.
+        :param background: Decompresses on a background thread, see *open*.
+        :return: The file contents.
+        """
+
+        def read_csv(csv: str) -> list[str]:
+            l: list[str] = []
+            csv = Py5FileReader.open(csv, background)
+            r = xls.reader(csv)
+            for csv_ln in r:
+                l.append(str(csv_ln))
+            csv.close()
+            return l
+
+        def read_xml(xml: str) -> list[str]:
+            l: list[str] = []
+            xml = Py5FileReader.open(xml, background)
+            for xml_ln in xml:
+                l.append(re.search(r"<([^>]+)>", xml_ln)[0])
+            xml.close()
+            return l
+
+        def read_md(md: str) -> list[str]:
+            l: list[str] = []
+            md = Py5FileReader.open(md, background)
+            for md_ln in md:
+                l.append(re.sub(r"^\s+", "", md_ln).strip("\n"))
+            md.close()
+            return l
+
+        def read_txt(txt: str, ln: Optional[int] = None, limiter: str = "\n") -> Union[str, list[str]]:
+            data: list[str] = []
+            f = Py5FileReader.open(txt, background)
+            current_line = 0
+            for f_ln in f:
+                current_line += 1
+                data.append(f_ln.strip(limiter).replace("\t", ""))
+                if ln is not None:
+                    if current_line == ln:
+                        return f_ln
+            if ln is not None:
+                if current_line < ln:
+                    raise Py5.Py5Error(f"Line number out of range.\nmaximum={current_line}; given={ln}")
+            f.close()
+            return data
+
+        def read_ini(ini: str) -> list[str]:
+            l: list[str] = []
+            ini = Py5FileReader.open(ini, background)
+            for ini_ln in ini:
+                l.append(ini_ln.strip("\n"))
+            ini.close()
+            return l
+
+        if not path.isfile(file):
+            raise Py5.Py5FileError(f"No such file, open '{file}'")
+
+        extension: str
+        if type(ext) is str:
+            extension = ext
+        else:
+            extension = ext.value
+
+        extension = extension.lower()
+
+        if extension == 'txt':
+            return read_txt(file, line, delimiter)
+        elif extension == 'csv':
+            return read_csv(file)
+        elif extension == 'xml':
+            return read_xml(file)
+        elif extension == 'md':
+            return read_md(file)
+        elif extension == 'ini':
+            return read_ini(file)
+        else:
+            error_msg = str(list(map(lambda x: x.name, Py5FileType.__members__.values()))).strip('[]')
+            raise Py5.Py5FileExtensionMismatchError(f"Expected one of {error_msg}, got '{extension}' instead.")
+
+
+class Py5BackgroundReader(io.RawIOBase):
+    """
+    Reads a binary stream on a background thread, e.g. a decompressing one, and hands the chunks to the reading
+    thread through a bounded queue. Wrap it in *io.BufferedReader* and *io.TextIOWrapper* to read lines.
+    """
+
+    def __init__(self, raw: IO[bytes], chunk_size: int = 1 << 18, depth: int = 4):
+        """
+        Starts reading 'raw' ahead.
+        :param raw: The stream to read, closed together with this reader.
+        :param chunk_size: The bytes read from 'raw' at once.
+        :param depth: The amount of chunks read ahead at most.
+        """
+        super().__init__()
+        self.__raw__ = raw
+        self.__chunk_size__ = chunk_size
+        self.__queue__ = queue.Queue(depth)
+        self.__stop__ = threading.Event()
+        self.__chunk__ = memoryview(b"")
+        self.__eof__ = False
+        self.__thread__ = threading.Thread(target=self.__fill__, name="Py5BackgroundReader", daemon=True)
+        self.__thread__.start()
+
+    def __fill__(self) -> None:
+        try:
+            while True:
+                chunk = self.__raw__.read(self.__chunk_size__)
+                if not self.__put__(chunk) or not chunk:
+                    return
+        except BaseException as e:
+            self.__put__(e)
+
+    def __put__(self, item: Union[bytes, BaseException]) -> bool:
+        while not self.__stop__.is_set():
+            try:
+                self.__queue__.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if not self.__chunk__:
+            if self.__eof__:
+                return 0
+            item = self.__queue__.get()
+            if isinstance(item, BaseException):
+                self.__eof__ = True
+                raise item
+            if not item:
+                self.__eof__ = True
+                return 0
+            self.__chunk__ = memoryview(item)
+        n = min(len(b), len(self.__chunk__))
+        b[:n] = self.__chunk__[:n]
+        self.__chunk__ = self.__chunk__[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self.__stop__.set()
+            self.__thread__.join()
+            self.__raw__.close()
+        super().close()
+
+
+class Py5FileFollower:
+    """
+    Follows a growing text file like ``tail -F``, every poll only reads the bytes appended since the previous one.
+
+    The byte offset and the inode are remembered, a truncated file is read again from its start and a rotated
+    (replaced) file is read to its end before the new file is followed. A last line of the old content without a
+    line break is returned as it is then, like ``tail -F`` does. Invalid bytes are decoded as U+FFFD.
+    """
+
+    file: str
+    offset: int
+    inode: int
+
+    def __init__(self, file: str, from_start: bool = False, encoding: str = "utf-8"):
+        """
+        Opens the file at its end, or at its start if 'from_start' is true.
+        :raises Py5FileError If the file is not existing.
+        """
+        if not path.isfile(file):
+            raise Py5.Py5FileError(f"No such file, open '{file}'")
+        self.file = file
+        self.encoding = encoding
+        self.__partial__ = b""
+        self.__open__()
+        if not from_start:
+            self.offset = self.__stream__.seek(0, os.SEEK_END)
+
+    def __open__(self) -> None:
+        self.__stream__ = open(self.file, "rb")
+        self.inode = os.fstat(self.__stream__.fileno()).st_ino
+        self.offset = 0
+        self.__partial__ = b""
+
+    def __read__(self) -> list[str]:
+        data = self.__partial__ + self.__stream__.read()
+        *lines, partial = data.split(b"\n")
+        # invalid bytes are replaced instead of losing the whole chunk
+        lines = [ln.rstrip(b"\r").decode(self.encoding, errors="replace") for ln in lines]
+        self.offset = self.__stream__.tell()
+        self.__partial__ = partial
+        return lines
+
+    def __rest__(self) -> list[str]:
+        # the last line of a replaced or truncated file never gets its line break, return it as it is
+        if not self.__partial__:
+            return []
+        line = self.__partial__.rstrip(b"\r").decode(self.encoding, errors="replace")
+        self.__partial__ = b""
+        return [line]
+
+    def poll(self) -> list[str]:
+        """
+        Returns the complete lines appended since the last poll, a line without its line break yet is kept back.
+        """
+        lines = self.__read__()
+        try:
+            stat = os.stat(self.file)
+        except FileNotFoundError:
+            # rotated away and not recreated yet
+            return lines
+
+        if stat.st_ino != self.inode:
+            # rotated, the rest of the old file was read above
+            lines += self.__rest__()
+            self.__stream__.close()
+            self.__open__()
+            lines += self.__read__()
+        elif stat.st_size < self.offset:
+            # truncated
+            lines += self.__rest__()
+            self.__stream__.seek(0)
+            self.offset = 0
+            lines += self.__read__()
+        return lines
+
+    def follow(self, interval: float = 0.5) -> Iterator[str]:
+        """ Yields new lines forever, waits 'interval' seconds whenever nothing new was written. """
+        while True:
+            lines = self.poll()
+            if not lines:
+                time.sleep(interval)
+            yield from lines
+
+    async def afollow(self, interval: float = 0.5) -> AsyncIterator[str]:
+        """ Same as :meth:`follow` for asyncio, ``async for line in follower.afollow(): ...`` """
+        import asyncio
+        while True:
+            lines = self.poll()
+            if not lines:
+                await asyncio.sleep(interval)
+            for line in lines:
+                yield line
+
+    def close(self) -> None:
+        """ Closes the file, the follower can not be used afterwards. """
+        self.__stream__.close()
+        Py5FileReader.__followers__.pop(self.file, None)
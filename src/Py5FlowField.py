@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+from array import array
+
+from Py5 import Py5
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Sequence
+
+    from Py5Vector import Py5Vector
+
+
+class Py5FlowField(object):
+    """
+    A grid of steering directions precomputed from *Py5.noise*, sampled with bilinear interpolation.\n
+    The grid has 'cols' x 'rows' nodes placed 'cell_size' apart, node (i, j) points into the direction
+    ``noise(i * noise_scale, j * noise_scale, z) * angle_scale`` in radians. With a 'z_step' the field is animated:
+    two noise slices are kept and blended while :meth:`advance` moves along z, and only one new slice is computed each
+    time a full step is passed.
+    """
+
+    cols: int
+    rows: int
+    cell_size: float
+    noise_scale: float
+    angle_scale: float
+    z: float
+    z_step: float
+
+    def __init__(self, cols: int, rows: int, cell_size: float = 1.0, noise_scale: float = 0.1,
+                 angle_scale: float = Py5.TWO_PI, z: float = 0.0, z_step: float = 0.0):
+        """
+        Creates the field and computes its first noise slice, or the first two if animated.
+        :raises Py5ValueError If the grid has less than 2 x 2 nodes.
+        :param cols: The amount of nodes along x.
+        :param rows: The amount of nodes along y.
+        :param cell_size: The distance between two nodes in sampling coordinates.
+        :param noise_scale: The noise offset between two nodes.
+        :param angle_scale: Multiplies the noise value into an angle, the default covers a full turn.
+        :param z: The noise z coordinate of the first slice.
+        :param z_step: The noise z offset between two animation slices, 0 for a static field.
+        """
+        if cols < 2 or rows < 2:
+            raise Py5.Py5ValueError(f"Expected at least 2 x 2 nodes, got {cols} x {rows} instead")
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.noise_scale = noise_scale
+        self.angle_scale = angle_scale
+        self.z = z
+        self.z_step = z_step
+
+        # blend factor between the current and the next slice
+        self.__t__ = 0.0
+        self.__slice_a__ = self.__slice__(z)
+        self.__slice_b__ = self.__slice__(z + z_step) if z_step else self.__slice_a__
+
+    def __slice__(self, z: float) -> tuple[array, array]:
+        noise = Py5.noise
+        s = self.noise_scale
+        a = self.angle_scale
+        angles = array("d", [noise(i * s, j * s, z) * a for j in range(self.rows) for i in range(self.cols)])
+        return array("d", map(math.cos, angles)), array("d", map(math.sin, angles))
+
+    def advance(self, amount: float) -> None:
+        """
+        Moves the field along z by 'amount' animation steps, e.g. ``0.05`` per frame blends into the next slice over
+        20 frames. Passing a whole step computes one new slice, passing several at once computes at most two.
+        :raises Py5ValueError If 'amount' is negative, the field only moves forward.
+        """
+        if amount < 0:
+            raise Py5.Py5ValueError(f"Expected a non-negative amount, got {amount} instead")
+        if not self.z_step:
+            return
+        t = self.__t__ + amount
+        steps = int(t)
+        self.__t__ = t - steps
+        if not steps:
+            return
+        self.z += steps * self.z_step
+        # the slices in between are never sampled, only the two around the new position are computed
+        self.__slice_a__ = self.__slice_b__ if steps == 1 else self.__slice__(self.z)
+        self.__slice_b__ = self.__slice__(self.z + self.z_step)
+
+    @property
+    def angles(self) -> array:
+        """ Gets the node angles of the current slice in radians, row by row. """
+        return array("d", map(math.atan2, self.__slice_a__[1], self.__slice_a__[0]))
+
+    def sample(self, xs: Sequence[float], ys: Sequence[float], out_x: Optional[array] = None,
+               out_y: Optional[array] = None) -> tuple[array, array]:
+        """
+        Returns the interpolated direction at every position in one batch, positions outside are clamped to the grid.
+        :raises ValueError If 'out_x' or 'out_y' is shorter than 'xs'.
+        :param xs: The x coordinates of the positions.
+        :param ys: The y coordinates of the positions.
+        :param out_x: Buffer for the x components, reuse it between frames.
+        :param out_y: Buffer for the y components, reuse it between frames.
+        :return: The x and y components, not normalized.
+        """
+        n = len(xs)
+        for out in (out_x, out_y):
+            if out is not None and len(out) < n:
+                raise ValueError(f"Expected an output buffer of at least {n} values, got {len(out)} instead")
+        if out_x is None:
+            out_x = array("d", bytes(8 * n))
+        if out_y is None:
+            out_y = array("d", bytes(8 * n))
+
+        cols = self.cols
+        max_x = cols - 1.0
+        max_y = self.rows - 1.0
+        inv = 1.0 / self.cell_size
+        t = self.__t__
+        blend = self.__slice_b__ is not self.__slice_a__ and t > 0.0
+        ax, ay = self.__slice_a__
+        bx, by = self.__slice_b__
+
+        for k in range(n):
+            gx = xs[k] * inv
+            gy = ys[k] * inv
+            gx = 0.0 if gx < 0.0 else max_x if gx > max_x else gx
+            gy = 0.0 if gy < 0.0 else max_y if gy > max_y else gy
+            i = int(gx)
+            j = int(gy)
+            if i == max_x:
+                i -= 1
+            if j == max_y:
+                j -= 1
+            fx = gx - i
+            fy = gy - j
+            w00 = (1.0 - fx) * (1.0 - fy)
+            w10 = fx * (1.0 - fy)
+            w01 = (1.0 - fx) * fy
+            w11 = fx * fy
+            p = j * cols + i
+            q = p + cols
+            vx = ax[p] * w00 + ax[p + 1] * w10 + ax[q] * w01 + ax[q + 1] * w11
+            vy = ay[p] * w00 + ay[p + 1] * w10 + ay[q] * w01 + ay[q + 1] * w11
+            if blend:
+                vx += t * (bx[p] * w00 + bx[p + 1] * w10 + bx[q] * w01 + bx[q + 1] * w11 - vx)
+                vy += t * (by[p] * w00 + by[p + 1] * w10 + by[q] * w01 + by[q + 1] * w11 - vy)
+            out_x[k] = vx
+            out_y[k] = vy
+
+        return out_x, out_y
+
+    def sample_angles(self, xs: Sequence[float], ys: Sequence[float]) -> array:
+        """ Returns the interpolated direction at every position as an angle in radians. """
+        vx, vy = self.sample(xs, ys)
+        return array("d", map(math.atan2, vy, vx))
+
+    def vector_at(self, x: float, y: float) -> Py5Vector:
+        """ Returns the interpolated direction at one position as a *Py5Vector*. """
+        from Py5Vector import Py5Vector
+        vx, vy = self.sample((x,), (y,))
+        return Py5Vector(vx[0], vy[0], 0.0, 0.0)
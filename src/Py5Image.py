@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import struct
+import zlib
+
+from Py5 import Py5
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Optional, Union
+
+    from Py5Colormap import Py5Colormap
+
+# extension -> supported channel counts
+FORMATS = {
+    "pgm": (1,),
+    "ppm": (3,),
+    "png": (1, 3, 4),
+}
+# channels -> PNG color type
+PNG_COLOR_TYPES = {1: 0, 3: 2, 4: 6}
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# compressed bytes collected before an IDAT chunk is written
+PNG_CHUNK_SIZE = 1 << 16
+
+
+class Py5ImageWriter(object):
+    """
+    Writes 8-bit PGM, PPM or PNG images row by row, only the current row and a bounded compression buffer are held
+    in memory.\n
+    ``with Py5ImageWriter("noise.png", 4096, 4096) as image: image.write_rows(rows)``
+    """
+
+    file: str
+    format: str
+    width: int
+    height: int
+    channels: int
+
+    def __init__(self, file: str, width: int, height: int, channels: int = 1, compression: int = 6):
+        """
+        Opens the file and writes the header, the format is taken from the extension.
+        :raises Py5FileExtensionMismatchError If the extension is not pgm, ppm or png.
+        :raises Py5ValueError If the format does not support the amount of channels.
+        :param file: The path to the file.
+        :param width: The width in pixels.
+        :param height: The height in pixels.
+        :param channels: 1 for gray, 3 for RGB, 4 for RGBA (PNG only).
+        :param compression: The zlib level of PNG files, from 0 to 9.
+        """
+        extension = file.rsplit(".", 1)[-1].lower()
+        if extension not in FORMATS:
+            raise Py5.Py5FileExtensionMismatchError(f"Expected one of {', '.join(FORMATS)}, got '{extension}' instead.")
+        if channels not in FORMATS[extension]:
+            raise Py5.Py5ValueError(f"'{extension}' supports {FORMATS[extension]} channels, got {channels} instead")
+
+        self.file = file
+        self.format = extension
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self.__rows__ = 0
+        self.__stream__ = open(file, "wb")
+
+        if extension == "png":
+            self.__compressor__ = zlib.compressobj(compression)
+            self.__pending__ = []
+            self.__pending_size__ = 0
+            self.__stream__.write(PNG_SIGNATURE)
+            self.__chunk__(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, PNG_COLOR_TYPES[channels], 0, 0, 0))
+        else:
+            magic = "P5" if extension == "pgm" else "P6"
+            self.__stream__.write(f"{magic}\n{width} {height}\n255\n".encode("ascii"))
+
+    def __enter__(self) -> 'Py5ImageWriter':
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.__stream__.close()
+
+    def __chunk__(self, kind: bytes, data: bytes) -> None:
+        self.__stream__.write(struct.pack(">I", len(data)))
+        self.__stream__.write(kind)
+        self.__stream__.write(data)
+        self.__stream__.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+    def __compressed__(self, data: bytes) -> None:
+        if not data:
+            return
+        self.__pending__.append(data)
+        self.__pending_size__ += len(data)
+        if self.__pending_size__ >= PNG_CHUNK_SIZE:
+            self.__chunk__(b"IDAT", b"".join(self.__pending__))
+            self.__pending__ = []
+            self.__pending_size__ = 0
+
+    def write_row(self, row: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Writes the next row of ``width * channels`` bytes.
+        :raises Py5ValueError If the row has the wrong length or the image is already complete.
+        """
+        if len(row) != self.width * self.channels:
+            raise Py5.Py5ValueError(f"Expected a row of {self.width * self.channels} bytes, got {len(row)} instead")
+        if self.__rows__ >= self.height:
+            raise Py5.Py5ValueError(f"The image already has all of its {self.height} rows")
+        self.__rows__ += 1
+        if self.format == "png":
+            # filter type 0, the row is stored as is
+            self.__compressed__(self.__compressor__.compress(b"\x00"))
+            self.__compressed__(self.__compressor__.compress(row))
+        else:
+            self.__stream__.write(row)
+
+    def write_rows(self, rows: Iterable[Union[bytes, bytearray, memoryview]]) -> None:
+        """ Writes every row of the iterable, rows are consumed one at a time. """
+        for row in rows:
+            self.write_row(row)
+
+    def close(self) -> None:
+        """
+        Finishes the file.
+        :raises Py5ValueError If fewer rows than the height were written, the file is closed anyway.
+        """
+        try:
+            if self.__rows__ != self.height:
+                raise Py5.Py5ValueError(f"Expected {self.height} rows, got {self.__rows__} instead")
+            if self.format == "png":
+                self.__compressed__(self.__compressor__.flush())
+                if self.__pending__:
+                    self.__chunk__(b"IDAT", b"".join(self.__pending__))
+                self.__chunk__(b"IEND", b"")
+        finally:
+            self.__stream__.close()
+
+    @staticmethod
+    def noise_rows(width: int, height: int, scale: float = 0.01, z: float = 0.0,
+                   colormap: Optional[Py5Colormap] = None, channels: int = 1) -> Iterator[bytes]:
+        """
+        Yields the rows of a noise texture one by one, computed only when requested.
+        :param width: The width in pixels.
+        :param height: The height in pixels.
+        :param scale: The noise offset between two pixels.
+        :param z: The noise z coordinate.
+        :param colormap: Colors the values, without it the rows are gray values.
+        :param channels: The bytes per pixel of a colored row, 3 drops the alpha channel of the colormap.
+        """
+        noise = Py5.noise
+        xs = [x * scale for x in range(width)]
+        for y in range(height):
+            sy = y * scale
+            values = [noise(sx, sy, z) for sx in xs]
+            if colormap is None:
+                yield bytes(0 if v < 0 else 255 if v > 255 else v for v in
+                            map(int, map((255.0).__mul__, values)))
+            else:
+                row = colormap.apply(values)
+                if channels == 3:
+                    del row[3::4]
+                yield bytes(row)
+
+    @staticmethod
+    def write_noise(file: str, width: int, height: int, scale: float = 0.01, z: float = 0.0,
+                    colormap: Optional[Py5Colormap] = None) -> None:
+        """
+        Streams a noise texture into a PGM, PPM or PNG file. Without a colormap PNG files are gray.
+        :raises Py5ValueError If a PGM file gets a colormap or a PPM file none.
+        """
+        extension = file.rsplit(".", 1)[-1].lower()
+        channels = 1 if colormap is None else 3 if extension == "ppm" else 4
+        with Py5ImageWriter(file, width, height, channels) as image:
+            image.write_rows(Py5ImageWriter.noise_rows(width, height, scale, z, colormap, channels))
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import re
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Union
+
+# Compiled once, every line is matched against BLOCK once and scanned by INLINE once.
+BLOCK = re.compile(
+    r"^(?:"
+    r"(?P<fence>\s*(?P<marker>`{3,}|~{3,})\s*(?P<lang>[^\s`]*).*)"
+    r"|(?P<hr>\s*(?P<rule>[-*_])(?:\s*(?P=rule)){2,}\s*)"
+    r"|(?P<heading>#{1,6})\s+(?P<title>.*?)(?:\s+#+)?\s*"
+    r"|\s*>\s?(?P<quote>.*)"
+    r"|(?P<indent>\s*)(?P<bullet>[-*+]|\d+[.)])\s+(?P<item>.*)"
+    r")$"
+)
+# Emphasis needs non-space text next to its delimiters (CommonMark's flanking rule), "a * b * c" stays text.
+# Underscores also only emphasize outside of words (the intraword rule), snake_case names stay text.
+INLINE = re.compile(
+    r"`(?P<code>[^`]+)`"
+    r"|\*\*(?P<b>[^*\s](?:[^*]*[^*\s])?)\*\*|(?<!\w)__(?P<b_>[^_\s](?:[^_]*[^_\s])?)__(?!\w)"
+    r"|~~(?P<strikethrough>[^~]+)~~"
+    r"|\*(?P<i>[^*\s](?:[^*]*[^*\s])?)\*|(?<!\w)_(?P<i_>[^_\s](?:[^_]*[^_\s])?)_(?!\w)"
+)
+
+
+class Py5Markdown:
+    """
+    A streaming markdown parser used by ``Py5FileReader.parse(file, Py5FileType.MARKDOWN)``.\n
+    Blocks are dictionaries with a 'type' (*h1* - *h6*, *p*, *li*, *blockquote*, *code_block* or *hr*) and either
+    'tokens' or 'text'. Tokens are ``(type, text)`` tuples with the types *text*, *code*, *b*, *i* and
+    *strikethrough*.
+    """
+
+    # path -> (mtime_ns, size, blocks)
+    __cache__: dict[str, tuple[int, int, list[dict]]] = {}
+
+    @staticmethod
+    def tokenize(line: str) -> list[tuple[str, str]]:
+        """ Splits a line into text, code, bold, italic and strikethrough tokens in a single pass. """
+        tokens = []
+        pos = 0
+        for match in INLINE.finditer(line):
+            if match.start() > pos:
+                tokens.append(("text", line[pos:match.start()]))
+            kind = match.lastgroup
+            tokens.append((kind.rstrip("_"), match[kind]))
+            pos = match.end()
+        if pos < len(line):
+            tokens.append(("text", line[pos:]))
+        return tokens
+
+    @staticmethod
+    def blocks(lines: Iterable[str]) -> Iterator[dict[str, Union[str, int, bool, list]]]:
+        """ Yields the blocks of the given lines one by one, the lines are only read as far as needed. """
+        tokenize = Py5Markdown.tokenize
+        paragraph: list[tuple[str, str]] = []
+        fence = None
+        code: list[str] = []
+        lang = ""
+
+        for line in lines:
+            line = line.rstrip("\r\n")
+
+            if fence is not None:
+                if line.strip().startswith(fence):
+                    yield {"type": "code_block", "lang": lang, "text": "\n".join(code)}
+                    fence = None
+                    code = []
+                else:
+                    code.append(line)
+                continue
+
+            match = BLOCK.match(line)
+            if match is None and line.strip():
+                if paragraph:
+                    paragraph.append(("text", " "))
+                paragraph.extend(tokenize(line.strip()))
+                continue
+
+            if paragraph:
+                yield {"type": "p", "tokens": paragraph}
+                paragraph = []
+            if match is None:
+                continue
+
+            if match["fence"] is not None:
+                fence = match["marker"]
+                lang = match["lang"]
+            elif match["hr"] is not None:
+                yield {"type": "hr"}
+            elif match["heading"] is not None:
+                yield {"type": f"h{len(match['heading'])}", "tokens": tokenize(match["title"])}
+            elif match["quote"] is not None:
+                yield {"type": "blockquote", "tokens": tokenize(match["quote"])}
+            else:
+                yield {"type": "li", "ordered": match["bullet"][0].isdigit(),
+                       "indent": len(match["indent"].expandtabs(4)), "tokens": tokenize(match["item"])}
+
+        if paragraph:
+            yield {"type": "p", "tokens": paragraph}
+        if fence is not None:
+            yield {"type": "code_block", "lang": lang, "text": "\n".join(code)}
+
+    @staticmethod
+    def parse(file: str, background: bool = False) -> list[dict[str, Union[str, int, bool, list]]]:
+        """
+        Parses a markdown file into its blocks. The result is cached and only parsed again if the modification
+        time or the size of the file changed, so do not modify the returned list.
+        :param file: The path to the file, compressed files are decompressed on the fly.
+        :param background: Decompresses on a background thread, see *Py5FileReader.open*.
+        :return: The blocks.
+        """
+        key = os.path.abspath(file)
+        stat = os.stat(key)
+        cached = Py5Markdown.__cache__.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        from Py5FileReader import Py5FileReader
+        with Py5FileReader.open(key, background, encoding="utf-8") as f:
+            blocks = list(Py5Markdown.blocks(f))
+        Py5Markdown.__cache__[key] = (stat.st_mtime_ns, stat.st_size, blocks)
+        return blocks
+
+    @staticmethod
+    def parse_tree(directory: str, extension: str = ".md") -> tuple[dict[str, list[dict]], list[str]]:
+        """
+        Parses every markdown file below 'directory', only files changed since the last call are parsed again.
+        :return: The blocks per file path and the paths which were (re)parsed.
+        """
+        blocks = {}
+        changed = []
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if not name.endswith(extension):
+                    continue
+                file = os.path.abspath(os.path.join(root, name))
+                before = Py5Markdown.__cache__.get(file)
+                blocks[file] = Py5Markdown.parse(file)
+                if before is None or before[2] is not blocks[file]:
+                    changed.append(file)
+        return blocks, changed
+
+    @staticmethod
+    def clear_cache() -> None:
+        """ Removes every cached file. """
+        Py5Markdown.__cache__.clear()
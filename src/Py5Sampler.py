@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from array import array
+
+from Py5 import Py5
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Sequence, Union
+
+    from Py5Types import T
+
+
+class Py5Sampler(object):
+    """
+    Draws random elements of a fixed population, optionally weighted, from its own seedable random stream.\n
+    The weights are turned into an alias table once (Vose's method), afterwards every draw costs one random number
+    and one comparison no matter how many elements there are or how skewed the weights are.\n
+    ``Py5Sampler(tiles, weights=[70, 20, 10], seed=1).sample_many(100_000)``
+    """
+
+    population: list[T]
+    weights: Optional[array]
+
+    def __init__(self, population: Sequence[T], weights: Optional[Sequence[float]] = None,
+                 seed: Optional[Union[int, float, str, bytes]] = None):
+        """
+        Copies the population once and builds the alias table.
+        :raises Py5ValueError If the population is empty, or the weights have a different length, are negative,
+         not finite or sum up to 0.
+        :param population: The elements to draw from, any sequence.
+        :param weights: The relative weight of every element, all elements are equally likely if not given.
+        :param seed: The seed of the random stream, see *random.seed*.
+        """
+        if not population:
+            raise Py5.Py5ValueError("Expected at least one element to sample from")
+        self.population = list(population)
+        self.__random__ = random.Random(seed)
+        self.weights = None
+        self.__probability__ = None
+        self.__alias__ = None
+        if weights is None:
+            return
+
+        n = len(self.population)
+        if len(weights) != n:
+            raise Py5.Py5ValueError(f"Expected {n} weights, got {len(weights)} instead")
+        self.weights = array("d", weights)
+        total = math.fsum(self.weights)
+        if not all(0.0 <= w < math.inf for w in self.weights) or not 0.0 < total < math.inf:
+            raise Py5.Py5ValueError("Expected finite, non-negative weights with a positive sum")
+
+        # every column k holds element k with probability[k] and alias[k] otherwise, each column is 1 / n of the mass
+        probability = array("d", (w * n / total for w in self.weights))
+        alias = array("q", range(n))
+        small = [k for k in range(n) if probability[k] < 1.0]
+        large = [k for k in range(n) if probability[k] >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large[-1]
+            alias[s] = g
+            probability[g] -= 1.0 - probability[s]
+            if probability[g] < 1.0:
+                small.append(large.pop())
+        # what is left over is 1 up to rounding errors
+        for k in small + large:
+            probability[k] = 1.0
+        self.__probability__ = probability
+        self.__alias__ = alias
+
+    def seed(self, seed: Optional[Union[int, float, str, bytes]] = None) -> None:
+        """ Reseeds the random stream, the same seed repeats the same draws. """
+        self.__random__.seed(seed)
+
+    def __len__(self) -> int:
+        return len(self.population)
+
+    def index(self) -> int:
+        """ Draws the index of one element. """
+        u = self.__random__.random() * len(self.population)
+        i = int(u)
+        if self.__probability__ is None or u - i < self.__probability__[i]:
+            return i
+        return self.__alias__[i]
+
+    def sample(self) -> T:
+        """ Draws one element. """
+        return self.population[self.index()]
+
+    def indices(self, k: int) -> list[int]:
+        """ Draws the indices of 'k' elements with replacement. """
+        rand = self.__random__.random
+        n = len(self.population)
+        if self.__probability__ is None:
+            return [int(rand() * n) for _ in range(k)]
+
+        probability = self.__probability__
+        alias = self.__alias__
+        out = [0] * k
+        for j in range(k):
+            u = rand() * n
+            i = int(u)
+            out[j] = i if u - i < probability[i] else alias[i]
+        return out
+
+    def sample_many(self, k: int) -> list[T]:
+        """ Draws 'k' elements with replacement, in one batch. """
+        return list(map(self.population.__getitem__, self.indices(k)))
+
+    def sample_unique(self, k: int) -> list[T]:
+        """
+        Draws 'k' different elements without replacement, heavier elements tend to come first.
+        Unlike draws with replacement this costs O(n log k), the alias table can not remove elements.
+        :raises Py5ValueError If less than 'k' elements can be drawn, elements with weight 0 are never drawn.
+        """
+        rand = self.__random__.random
+        n = len(self.population)
+        if self.weights is None:
+            if not 0 <= k <= n:
+                raise Py5.Py5ValueError(f"Expected at most {n} unique samples, got {k} instead")
+            return self.__random__.sample(self.population, k)
+
+        candidates = [i for i in range(n) if self.weights[i] > 0.0]
+        if not 0 <= k <= len(candidates):
+            raise Py5.Py5ValueError(f"Expected at most {len(candidates)} unique samples, got {k} instead")
+        # Efraimidis-Spirakis, the k largest keys u ** (1 / w) in log space
+        weights = self.weights
+        keys = [(math.log(1.0 - rand()) / weights[i], i) for i in candidates]
+        return [self.population[i] for _, i in heapq.nlargest(k, keys)]
@@ -0,0 +1,26 @@
+from enum import Enum
+from typing import TypeVar
+
+T = TypeVar('T', object, int, float, str)
+
+
+# used for changing modes
+class MODE(Enum):
+    DEGREES = True
+    RADIANS = False
+
+
+class COMPLEX(Enum):
+    COMPLEX = True
+    SIMPLE = False
+
+
+class PRECISION(Enum):
+    TABLE = True
+    EXACT = False
+
+
+# default vars
+DEFAULT_MODE = MODE.RADIANS
+DEFAULT_COMPLEX = COMPLEX.SIMPLE
+DEFAULT_PRECISION = PRECISION.EXACT
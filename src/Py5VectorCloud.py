@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from Py5 import Py5
+from Py5Vector import Py5Vector
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, Optional, Sequence
+
+# magic, version, dtype, dimensions, count, padded to 32 bytes so every column stays aligned
+HEADER = struct.Struct("<4sHcBQ16x")
+MAGIC = b"PY5V"
+VERSION = 1
+DTYPES = ("d", "f")
+AXES = ("x", "y", "z", "w")
+
+
+class Py5VectorCloud(object):
+    """
+    A memory-mapped collection of vectors stored in the *.py5v* binary format.\n
+    The file has a 32 byte header (magic ``PY5V``, version, dtype ``d``/``f``, dimensions, count) followed by one
+    packed little-endian column per axis. :meth:`load` maps the file instead of reading it, so even multi-million
+    point clouds open instantly and :attr:`x`, :attr:`y`, :attr:`z` and :attr:`w` are zero-copy *memoryview* columns.
+    """
+
+    file: str
+    dtype: str
+    dims: int
+    x: memoryview
+    y: memoryview
+    z: Optional[memoryview]
+    w: Optional[memoryview]
+
+    def __init__(self, file: str):
+        """
+        Maps a *.py5v* file, same as :meth:`load`.
+        :raises Py5FileError If the file is not a *.py5v* file or is truncated.
+        """
+        self.file = file
+        with open(file, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise Py5.Py5FileError(f"'{file}' is too short for a py5v header")
+            self.__map__ = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, dtype, dims, count = HEADER.unpack_from(self.__map__)
+        dtype = dtype.decode("ascii")
+        if magic != MAGIC or version != VERSION or dtype not in DTYPES or not 2 <= dims <= 4:
+            self.__map__.close()
+            raise Py5.Py5FileError(f"'{file}' is not a py5v file of version {VERSION}")
+
+        size = array(dtype).itemsize * count
+        if len(self.__map__) < HEADER.size + size * dims:
+            self.__map__.close()
+            raise Py5.Py5FileError(f"'{file}' is truncated, expected {count} vectors")
+
+        self.dtype = dtype
+        self.dims = dims
+        self.__count__ = count
+        self.__columns__()
+
+    def __columns__(self) -> None:
+        size = array(self.dtype).itemsize * self.__count__
+        self.__views__ = [memoryview(self.__map__)]
+        columns = []
+        for k in range(self.dims):
+            offset = HEADER.size + k * size
+            raw = self.__views__[0][offset:offset + size]
+            if sys.byteorder == "little":
+                column = raw.cast(self.dtype)
+            else:
+                # the file is little-endian, big-endian machines get a swapped copy
+                column = array(self.dtype)
+                column.frombytes(raw)
+                column.byteswap()
+                column = memoryview(column)
+            self.__views__.extend((raw, column))
+            columns.append(column)
+        columns += [None] * (4 - self.dims)
+        self.x, self.y, self.z, self.w = columns
+
+    @staticmethod
+    def load(file: str) -> 'Py5VectorCloud':
+        """ Maps a *.py5v* file, see :class:`Py5VectorCloud`. """
+        return Py5VectorCloud(file)
+
+    @staticmethod
+    def save(file: str, vectors: Sequence[Py5Vector], dims: Optional[int] = None, dtype: str = "d") -> None:
+        """
+        Saves vectors into a *.py5v* file.
+        :param file: The path to the file.
+        :param vectors: The vectors, missing z and w values are stored as 0.
+        :param dims: The stored axes from 2 to 4, by default the axes any vector uses (non-zero z or w).
+        :param dtype: 'd' for float64 or 'f' for float32 columns.
+        """
+        if dims is None:
+            dims = 4 if any(v.w for v in vectors) else 3 if any(v.z for v in vectors) else 2
+        columns = [[getattr(v, axis) or 0.0 for v in vectors] for axis in AXES[:dims]]
+        Py5VectorCloud.save_columns(file, *columns, dtype=dtype)
+
+    @staticmethod
+    def save_columns(file: str, x: Sequence[float], y: Sequence[float], z: Optional[Sequence[float]] = None,
+                     w: Optional[Sequence[float]] = None, dtype: str = "d") -> None:
+        """
+        Saves coordinate columns (lists, arrays or the columns of another cloud) into a *.py5v* file.
+        :raises Py5ValueError If the columns differ in length, 'w' is given without 'z' or the dtype is unknown.
+        """
+        if dtype not in DTYPES:
+            raise Py5.Py5ValueError(f"Expected one of {DTYPES} as dtype, got '{dtype}' instead")
+        if w is not None and z is None:
+            raise Py5.Py5ValueError("Expected a z column when a w column is given")
+        columns = [column for column in (x, y, z, w) if column is not None]
+        if any(len(column) != len(x) for column in columns):
+            raise Py5.Py5ValueError(f"Expected columns of equal length, got {[len(c) for c in columns]} instead")
+
+        with open(file, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, dtype.encode("ascii"), len(columns), len(x)))
+            for column in columns:
+                packed = column if type(column) is array and column.typecode == dtype else array(dtype, column)
+                if sys.byteorder != "little":
+                    packed = array(dtype, packed)
+                    packed.byteswap()
+                packed.tofile(f)
+
+    def __len__(self) -> int:
+        return self.__count__
+
+    def __getitem__(self, i: int) -> Py5Vector:
+        """ Returns the vector at index 'i' as a new *Py5Vector*. """
+        if i < 0:
+            i += self.__count__
+        if not 0 <= i < self.__count__:
+            raise IndexError(f"Index {i} out of range for {self.__count__} vectors")
+        return Py5Vector(self.x[i], self.y[i],
+                         self.z[i] if self.z is not None else 0.0,
+                         self.w[i] if self.w is not None else 0.0)
+
+    def __iter__(self) -> Iterator[Py5Vector]:
+        for i in range(self.__count__):
+            yield self[i]
+
+    def __enter__(self) -> 'Py5VectorCloud':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases the columns and unmaps the file, the columns can not be used afterwards.
+        :raises BufferError If slices of the columns (e.g. ``cloud.x[0:10]``) are still referenced, the cloud stays
+         open and usable then.
+        """
+        if self.__map__.closed:
+            return
+        try:
+            for view in reversed(self.__views__):
+                view.release()
+            self.__map__.close()
+        except BufferError:
+            self.__columns__()
+            raise BufferError(f"'{self.file}' is still referenced by slices of its columns, release them first")
+        self.__views__ = []
+        self.x = self.y = self.z = self.w = None